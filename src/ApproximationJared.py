@@ -1,102 +1,171 @@
 import time
-import difficult_datasets as dd
+from bipartite import Biclique
+from biadjacency import Biadjacency
+from instrument import NULL
 
 format = False
 
 def handle_data(index_graph):
-    # Create new empty matrix with same size as sorted_graph
-    n = len(index_graph)//2
-    new_matrix = [[0]*n for _ in range(n)]
-    for i in range(n):
-        for j in range(2):
-            if j == 0:
-                row = index_graph[i][j]
-            elif j == 1:
-                col = index_graph[i][j]
-        if col != row:
-            new_matrix[row][col] = 1
-            new_matrix[col][row] = 1
-    return new_matrix
-
-
-
-def sort_graph(graph):
-    sorted_graph = sorted(graph, key=lambda x: sum(x), reverse=True)
-    #print("Sorted graph by number of trues in each row:")
-    # Move all the trues to the left of the matrix so it form a triangle
-    
-    n = len(sorted_graph)
-    for i in range(n):
-        m = len(sorted_graph[i])
-        true_count = sum(sorted_graph[i])
-        for j in range(m):
-            if j < true_count:
-                sorted_graph[i][j] = 1
-            else:
-                sorted_graph[i][j] = 0
-    #print("Triangular form of the graph:")
-    #for row in sorted_graph:
-        #print(row)
-    return sorted_graph
+    # Edge list [(u, v), ...] -> |U| x |V| biadjacency with remapped ids
+    return Biadjacency(index_graph)
+
+
+
+class PackedMatrix:
+    """
+    Boolean matrix stored as one Python int per row (bit j = column j).
+    Row counts are kept up to date as cells are cleared, and rows are kept
+    in buckets by count so they can be visited from most to fewest trues
+    without sorting. Columns keep their original positions, so a cleared
+    block is a real set of (row, column) pairs.
+    """
+
+    def __init__(self, matrix):
+        if isinstance(matrix, Biadjacency):
+            # Already packed; rows (U) and columns (V) are different vertex sets
+            self.rows = list(matrix.rows)
+            self.num_cols = matrix.num_cols
+        else:
+            self.rows = []
+            self.num_cols = max((len(matrix_row) for matrix_row in matrix), default=0)
+            for matrix_row in matrix:
+                bits = 0
+                for j, cell in enumerate(matrix_row):
+                    if cell:
+                        bits |= 1 << j
+                self.rows.append(bits)
+        self.counts = [popcount(bits) for bits in self.rows]
+        self.buckets = {}       # count -> rows with that many trues (dict used as an ordered set)
+        for i, c in enumerate(self.counts):
+            if c > 0:
+                self.buckets.setdefault(c, {})[i] = None
+        self.symmetric = not isinstance(matrix, Biadjacency) and all(
+            j < len(self.rows) and ((self.rows[j] >> i) & 1)
+            for i in range(len(self.rows)) for j in bit_indexes(self.rows[i])
+        )
+        # A symmetric matrix without self-loops is the adjacency matrix of a graph on one vertex set
+        self.adjacency = self.symmetric and not any((self.rows[i] >> i) & 1 for i in range(len(self.rows)))
+
+    def is_empty(self):
+        return not self.buckets
+
+    def rows_by_count(self):
+        """Non-empty rows from most to fewest trues (bucket order)."""
+        for c in sorted(self.buckets, reverse=True):
+            yield from self.buckets[c]
+
+    def clear_row_bits(self, i, mask):
+        """Sets the cells of row i under mask to 0 and moves the row to its new bucket."""
+        removed = popcount(self.rows[i] & mask)
+        if removed == 0:
+            return
+        old = self.counts[i]
+        del self.buckets[old][i]
+        if not self.buckets[old]:
+            del self.buckets[old]
+        self.rows[i] &= ~mask
+        self.counts[i] = old - removed
+        if self.counts[i] > 0:
+            self.buckets.setdefault(self.counts[i], {})[i] = None
+
+
+def popcount(bits):
+    return bin(bits).count("1")
+
+
+def bit_indexes(bits):
+    while bits:
+        low_bit = bits & -bits
+        yield low_bit.bit_length() - 1
+        bits ^= low_bit
+
 
 def find_largest_square_submatrix(matrix):
-    n = len(matrix)
-    # Create a list of the indexes of the last true (1) in each row
-    last_true_indexes = []
-    for i in range(n):
-        last_index = -1
-        for j in range(len(matrix[i]) - 1, -1, -1):  # Search from right to left
-            if matrix[i][j] == 1:
-                last_index = j
-                break
-        last_true_indexes.append(last_index+1) # Make 1 larger for math reasons
-    #print("Indexes of last true in each row:", last_true_indexes)
-    large_size = 0
-    size = -1
-    index = -1
-    indexes = last_true_indexes.copy()
-    for i in range(len(indexes)):
-        size = indexes[i] * (i+1)
+    """
+    Walks the rows from most to fewest trues, keeping the columns that are
+    true in every row so far; the best prefix (rows x common columns) is the
+    largest all-true block found. The walk stops once the common columns
+    times the remaining rows cannot beat it.
+    Returns (rows, column mask, size).
+    """
+    best_rows, best_cols, large_size = [], 0, 0
+    common = -1     # all columns
+    rows = []
+    remaining = sum(len(bucket) for bucket in matrix.buckets.values())
+    for i in matrix.rows_by_count():
+        common &= matrix.rows[i]
+        width = popcount(common)
+        if width * remaining <= large_size:
+            break
+        rows.append(i)
+        size = width * len(rows)
         if size > large_size:
             large_size = size
-            index = i
-    #print(f"Largest square sub-matrix size: {large_size} at row index: {index}")
-    return index, indexes[index], large_size
-
-def swap_trues(matrix, index, bottom_row):
-    for i in range(index+1):
-        for j in range(bottom_row):
-            if matrix[i][j] == 1:
-                matrix[i][j] = 0
+            best_rows, best_cols = list(rows), common
+    return best_rows, best_cols, large_size
+
+
+def swap_trues(matrix, rows, cols):
+    """
+    Changes the trues of the block rows x cols to false. For an adjacency
+    matrix the mirrored block is the same set of edges, so it is cleared as
+    well.
+    """
+    row_mask = 0
+    for i in rows:
+        row_mask |= 1 << i
+        matrix.clear_row_bits(i, cols)
+    if matrix.adjacency:
+        for j in bit_indexes(cols):
+            matrix.clear_row_bits(j, row_mask)
     return matrix
 
+
+def bipartite_cover(graph, row_labels=None, col_labels=None, instrument=None):
+    """
+    Repeatedly clears the largest all-true block until the matrix is empty
+    and returns the blocks as Biclique records. Takes a Biadjacency (rows
+    and columns named by their U and V vertex ids) or a 0/1 list-of-lists:
+    for an adjacency matrix (edges_to_matrix) rows and columns are both named
+    by their index, i.e. the vertex id; for any other matrix rows and columns
+    are different vertex sets, so by default columns are numbered after the
+    rows.
+    instrument (see instrument.py) receives the pack / cover phases and the
+    number of blocks and of cells they cleared.
+    """
+    instrument = NULL if instrument is None else instrument
+    with instrument.phase("pack"):
+        if format:
+            # Handle the data to get binary matrix
+            readable_graph = handle_data(graph)
+        else:
+            readable_graph = graph
+        matrix = PackedMatrix(readable_graph)
+    if isinstance(readable_graph, Biadjacency):
+        row_labels = readable_graph.row_labels if row_labels is None else row_labels
+        col_labels = readable_graph.col_labels if col_labels is None else col_labels
+    if row_labels is None:
+        row_labels = range(len(matrix.rows))
+    if col_labels is None:
+        offset = 0 if matrix.adjacency else len(matrix.rows)
+        col_labels = range(offset, offset + matrix.num_cols)
+
+    cover = []
+    cells_cleared = 0
+    with instrument.phase("cover"):
+        while not matrix.is_empty():
+            # Find the largest sub-matrix of trues
+            rows, cols, size = find_largest_square_submatrix(matrix)
+            cover.append(Biclique({row_labels[i] for i in rows}, {col_labels[j] for j in bit_indexes(cols)}))
+            cells_cleared += size
+            # Change the trues to false in the sub-matrix
+            swap_trues(matrix, rows, cols)
+    instrument.add_counts({"blocks": len(cover), "cells_cleared": cells_cleared})
+    return cover
+
+
 def bipartite(graph):
-    num_bq = 0
-    if format:
-        # Handle the data to get binary matrix
-        readable_graph = handle_data(graph)
-    else:
-        readable_graph = graph
-    while True:
-        # Find how many trues are in each row
-        counts = [sum(row) for row in readable_graph]
-        #print("Counts of trues in each row:", counts)
-
-        # Sort the matrix by largest trues to least trues
-        readable_graph = sort_graph(readable_graph)
-        # Find the largest square sub-matrix of trues
-        index, row, size = find_largest_square_submatrix(readable_graph)
-        if size <= 1:
-            num_bq += 1
-            #print("No more square sub-matrix of size > 1 found. Exiting.")
-            break
-        num_bq += 1
-        # Change the trues to false in the sub-matrix
-        readable_graph = swap_trues(readable_graph, index, row)
-        #print("Modified matrix after swapping trues to false in the sub-matrix:")
-        #for row in readable_graph:
-            #print(row)
-    return num_bq
+    return len(bipartite_cover(graph))
 
 if __name__ == "__main__":
 
@@ -122,7 +191,8 @@ if __name__ == "__main__":
     [ 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1 ],
     [ 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1 ],
     ]
-    graph8 = dd.difficult_graphs["Crown_S10"]
+    import datasets
+    graph8 = datasets.get("Crown_S10")
 
     start_time = time.time()
     num_bq = bipartite(graph)
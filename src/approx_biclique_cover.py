@@ -1,50 +1,380 @@
 
-from typing import Generator, Optional
+from typing import Generator, Optional, Dict, Set, Tuple, List, Iterator
 from graph import Graph
-from bipartite import CompleteBipartiteGraph
+from bipartite import Biclique
+from instrument import NULL
 import random
-from math import isqrt
+from math import isqrt, inf
+from heapq import heappush, heappop
+from itertools import count
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
 
 
-def approx_biclique_cover(G: Graph, k: Optional[int] = None) -> Generator[CompleteBipartiteGraph, None, None]:
-    
-    def uncovered_neighbors(v):
-        return {w for e in E if (v in e) for w in e.vertices() if (v != w)}
+UncoveredIndex = Dict[int, Set[int]]
+EdgeKey = Tuple[int, int]
+
+
+def edge_key(u: int, v: int) -> EdgeKey:
+    return (u, v) if (u < v) else (v, u)
+
+
+class UncoveredEdges:
+    # uncovered edges in an array plus a position map: removal swaps the last edge into the hole (O(1)),
+    # and sampling draws indices directly (O(k)) instead of copying the whole set every round
+
+    def __init__(self) -> None:
+        self._edges : List[EdgeKey] = []
+        self._pos : Dict[EdgeKey, int] = {}
+
+    def add(self, e : EdgeKey) -> None:
+        if e not in self._pos:
+            self._pos[e] = len(self._edges)
+            self._edges.append(e)
+
+    def discard(self, e : EdgeKey) -> None:
+        i = self._pos.pop(e, None)
+        if i is None:
+            return
+        last = self._edges.pop()
+        if i < len(self._edges):
+            self._edges[i] = last
+            self._pos[last] = i
+
+    def sample(self, k : int, rng : random.Random) -> List[EdgeKey]:
+        return [self._edges[i] for i in rng.sample(range(len(self._edges)), k)]
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __contains__(self, e : EdgeKey) -> bool:
+        return e in self._pos
+
+    def __iter__(self) -> Iterator[EdgeKey]:
+        yield from self._edges
+
+
+def uncovered_index(G: Graph) -> Tuple[UncoveredEdges, UncoveredIndex]:
+    # uncovered edges (as vertex pairs) and the uncovered neighbors of every vertex
+    E = UncoveredEdges()
+    N = {v: set() for v in G.vertices()}
+    for e in G.C.keys():
+        u, v = e.vertices()
+        if u != v:
+            E.add(edge_key(u, v))
+            N[u].add(v)
+            N[v].add(u)
+    return E, N
+
+
+def converge(N: UncoveredIndex, u: int, v: int, orient: bool = False, reads: Optional[Set[int]] = None,
+             tally: Optional[Dict[str, int]] = None) -> Tuple[Set[int], Set[int]]:
+    # grow the edge (u, v) into a biclique of uncovered edges, L = N(u) on the side of v and R on the side of u;
+    # if a set is passed as reads, every vertex whose uncovered neighbors were looked at is added to it,
+    # if a dict is passed as tally, the number of refinement steps is added to its "convergence_iterations"
+    L = set(N[u])
+    R = N[v] - L
+    if orient and len(L) < len(R):
+        L, R = R, L
+    if reads is not None:
+        reads.update((u, v))
+
+    # loop until convergence on biclique
+    iterations = 0
+    while L and R:
+        iterations += 1
+        L_old, R_old = L, R
+        L = set.intersection(*[N[w] for w in R])
+        R = set.intersection(*[N[w] for w in L]) - L
+        if reads is not None:
+            reads.update(R_old, L)
+        if (L_old == L) and (R_old == R):
+            break
+    if tally is not None:
+        tally["convergence_iterations"] = tally.get("convergence_iterations", 0) + iterations
+    return L, R
+
+
+def uncovered_count(N: UncoveredIndex, L: Set[int], R: Set[int]) -> int:
+    # number of uncovered edges a biclique L x R would cover (L and R are disjoint)
+    if len(L) > len(R):
+        L, R = R, L
+    return sum(len(N[w].intersection(R)) for w in L)
+
+
+def cover(E: Optional[UncoveredEdges], N: UncoveredIndex, L: Set[int], R: Set[int]) -> None:
+    # mark the edges of L x R as covered, touching only the edges that are removed; they leave E in edge_key order,
+    # so the order of E (and with it every later sample) does not depend on set iteration order
+    if len(L) > len(R):
+        L, R = R, L
+    removed = []
+    for u in L:
+        for w in N[u].intersection(R):
+            N[u].discard(w)
+            N[w].discard(u)
+            removed.append(edge_key(u, w))
+    if E is not None:
+        for e in sorted(removed):
+            E.discard(e)
+
+
+class ConvergenceCache:
+    # converged (seed edge -> L, R, covered edges) results, reused until a covered biclique touches a vertex
+    # whose uncovered neighbors the convergence looked at; only then can the result have changed
+
+    def __init__(self) -> None:
+        self._entries : Dict[EdgeKey, Tuple[Set[int], Set[int], int]] = {}
+        self._readers : Dict[int, Set[EdgeKey]] = defaultdict(set)     # vertex -> seeds whose result read it
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) if (lookups > 0) else 0.0
+
+    def evaluate(self, N: UncoveredIndex, u: int, v: int, orient: bool = False,
+                 tally: Optional[Dict[str, int]] = None) -> Tuple[Set[int], Set[int], int]:
+        e = (u, v)
+        if e in self._entries:
+            self.hits += 1
+            return self._entries[e]
+        self.misses += 1
+        reads = set()
+        L, R = converge(N, u, v, orient, reads, tally)
+        result = (L, R, uncovered_count(N, L, R))
+        self._entries[e] = result
+        for w in reads:
+            self._readers[w].add(e)
+        return result
+
+    def invalidate(self, L: Set[int], R: Set[int]) -> None:
+        # L x R was just covered, so the uncovered neighbors of exactly these vertices changed
+        for w in (*L, *R):
+            for e in self._readers.pop(w, ()):
+                if self._entries.pop(e, None) is not None:
+                    self.invalidations += 1
+
+    def __repr__(self) -> str:
+        return f"ConvergenceCache(hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.3f}, invalidations={self.invalidations})"
+
+
+Candidate = Tuple[int, float, Set[int], Set[int]]      # (covered edges, sample index, L, R)
+
+
+def best_of(N: UncoveredIndex, seeds: List[Tuple[int, EdgeKey]], orient: bool, cache: Optional[ConvergenceCache] = None,
+            tally: Optional[Dict[str, int]] = None) -> Candidate:
+    # converge every (sample index, seed edge) and keep the biclique covering the most uncovered edges;
+    # ties go to the lowest sample index, so splitting the samples across workers gives the serial answer
+    best = (0, inf, set(), set())
+    for i, (u, v) in seeds:
+        if cache is None:
+            L, R = converge(N, u, v, orient, tally=tally)
+            covered_edges = uncovered_count(N, L, R)
+        else:
+            L, R, covered_edges = cache.evaluate(N, u, v, orient, tally)
+        if (covered_edges > best[0]) or ((covered_edges == best[0]) and (covered_edges > 0) and (i < best[1])):
+            best = (covered_edges, i, L, R)
+    return best
+
+
+def _evaluation_worker(conn, N: UncoveredIndex, orient: bool) -> None:
+    # worker process with its own replica of the uncovered index: each message carries the bicliques covered
+    # since the previous round (applied to the replica) and this worker's share of the round's samples
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        covered, seeds = message
+        for L, R in covered:
+            cover(None, N, L, R)
+        conn.send(best_of(N, seeds, orient))
+    conn.close()
+
+
+class SampleEvaluator:
+    # evaluates the samples of a round on a pool of workers
+    #   processes: each worker holds a replica of the uncovered index, sent once; afterwards a round only ships
+    #              the seeds and the previous round's biclique, so messages stay O(k + |L| + |R|)
+    #   threads:   the workers read the shared index directly (only faster on free-threaded Python)
+
+    def __init__(self, N: UncoveredIndex, orient: bool, workers: int, use_threads: bool = False) -> None:
+        self._N = N
+        self._orient = orient
+        self._workers = workers
+        self._pending : List[Tuple[Set[int], Set[int]]] = []
+        self._pool = None
+        self._connections = []
+        self._processes = []
+        if use_threads:
+            self._pool = ThreadPoolExecutor(max_workers=workers)
+        else:
+            for _ in range(workers):
+                parent_conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_evaluation_worker, args=(child_conn, N, orient), daemon=True)
+                process.start()
+                child_conn.close()
+                self._connections.append(parent_conn)
+                self._processes.append(process)
+
+    def covered(self, L: Set[int], R: Set[int]) -> None:
+        # the main process has covered L x R; worker replicas catch up with the next round
+        if self._connections:
+            self._pending.append((L, R))
+
+    def best_of(self, E_sample: List[EdgeKey]) -> Candidate:
+        seeds = list(enumerate(E_sample))
+        shares = [seeds[i::self._workers] for i in range(self._workers)]
+        if self._pool is not None:
+            results = list(self._pool.map(lambda share: best_of(self._N, share, self._orient), shares))
+        else:
+            for conn, share in zip(self._connections, shares):
+                conn.send((self._pending, share))
+            self._pending = []
+            results = [conn.recv() for conn in self._connections]
+        return max(results, key=lambda result: (result[0], -result[1]))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+        for conn in self._connections:
+            conn.send(None)
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._connections, self._processes = [], []
+
+
+def _greedy_cover(G: Graph, k: Optional[int], orient: bool, rng: Optional[random.Random],
+                  workers: int = 1, use_threads: bool = False, cache: Optional[ConvergenceCache] = None,
+                  instrument=None) -> Generator[Biclique, None, None]:
+
+    instrument = NULL if (instrument is None) else instrument
+    k = isqrt(G.m)+1 if (k is None) else k      # number of samples
+    rng = random if (rng is None) else rng      # a seeded random.Random makes runs reproducible
+    with instrument.phase("index"):
+        E, N = uncovered_index(G)               # uncovered edges, uncovered neighbors
+    evaluator = SampleEvaluator(N, orient, workers, use_threads) if (workers > 1) else None
+    tally = {"rounds": 0, "samples": 0}         # reported to the instrument once, at the end
+
+    try:
+        while len(E) > 0:
+
+            with instrument.phase("evaluate"):
+                E_sample = list(E) if (len(E) <= k) else E.sample(k, rng)
+                if evaluator is None:
+                    most_covered_edges, _, best_L, best_R = best_of(N, list(enumerate(E_sample)), orient, cache, tally)
+                else:
+                    most_covered_edges, _, best_L, best_R = evaluator.best_of(E_sample)
+            tally["rounds"] += 1
+            tally["samples"] += len(E_sample)
+
+            if most_covered_edges == 0:
+                # backup biclique in case loop results in empty graph, so algorithm always makes progress
+                u, v = next(iter(E))
+                best_L, best_R = {u}, {v}
+
+            with instrument.phase("cover"):
+                cover(E, N, best_L, best_R)     # remove edges that are now covered by the best biclique
+                if evaluator is not None:
+                    evaluator.covered(best_L, best_R)
+                if cache is not None:
+                    cache.invalidate(best_L, best_R)
+
+            yield Biclique(best_L, best_R)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+        instrument.add_counts(tally)
+
+
+# Passing a ConvergenceCache reuses converged samples across rounds and counts hits (serial evaluation only)
+# Passing an instrument.Instrument collects the index / evaluate / cover phase times and the rounds, samples
+# evaluated and convergence iterations (the latter with serial evaluation only)
+
+def approx_biclique_cover(G: Graph, k: Optional[int] = None, rng: Optional[random.Random] = None,
+                          workers: int = 1, use_threads: bool = False, cache: Optional[ConvergenceCache] = None,
+                          instrument=None) -> Generator[Biclique, None, None]:
+    return _greedy_cover(G, k, orient=False, rng=rng, workers=workers, use_threads=use_threads, cache=cache,
+                         instrument=instrument)
+
+
+def optimized_approx_biclique_cover(G: Graph, k: Optional[int] = None, rng: Optional[random.Random] = None,
+                                    workers: int = 1, use_threads: bool = False, cache: Optional[ConvergenceCache] = None,
+                                    instrument=None) -> Generator[Biclique, None, None]:
+    # same engine, but the larger neighborhood of each sampled edge is used as the starting L
+    return _greedy_cover(G, k, orient=True, rng=rng, workers=workers, use_threads=use_threads, cache=cache,
+                         instrument=instrument)
+
+
+def lazy_approx_biclique_cover(G: Graph, k: Optional[int] = None, refresh: int = 3, rng: Optional[random.Random] = None,
+                               cache: Optional[ConvergenceCache] = None, instrument=None) -> Generator[Biclique, None, None]:
     
+    # Lazy-greedy variant: sampled seed edges are kept in a max-heap keyed by the last known number of uncovered
+    # edges their converged biclique covers. Covering edges (almost always) only lowers these scores, so only the
+    # top seed is re-converged when popped: if its fresh score still beats the next key it is taken, otherwise it
+    # is re-inserted with the fresh score. Each round adds `refresh` new seeds (k when the heap runs dry).
+
+    def evaluate(e):
+        u, v = e
+        tally["samples"] += 1
+        if cache is None:
+            L, R = converge(N, u, v, tally=tally)
+            covered_edges = uncovered_count(N, L, R)
+        else:
+            L, R, covered_edges = cache.evaluate(N, u, v, tally=tally)
+        if covered_edges == 0:
+            L, R, covered_edges = {u}, {v}, 1     # the seed edge itself always makes progress
+        return L, R, covered_edges
+
+    def push_samples(n):
+        for e in (list(E) if (len(E) <= n) else E.sample(n, rng)):
+            if e not in queued:
+                queued.add(e)
+                heappush(heap, (-evaluate(e)[2], next(tiebreak), e))
+
+    instrument = NULL if (instrument is None) else instrument
     k = isqrt(G.m)+1 if (k is None) else k      # number of samples
-    E = set(G.C.keys())                         # uncovered edges
+    rng = random if (rng is None) else rng
+    with instrument.phase("index"):
+        E, N = uncovered_index(G)               # uncovered edges, uncovered neighbors
+    tally = {"rounds": 0, "samples": 0}         # reported to the instrument once, at the end
+    heap = []                                   # (-last known score, insertion order, seed edge)
+    queued = set()                              # seed edges currently in the heap
+    tiebreak = count()
 
-    while len(E) > 0:
+    push_samples(k)
 
-        u, v = next(iter(E)).vertices()
-        B = CompleteBipartiteGraph({u}, {v})    # backup biclique in case loop results in empty graph, so algorithm always makes progress
+    try:
+        while len(E) > 0:
 
-        E_sample = E if (len(E) <= k) else set(random.sample(list(E), k))
-        most_covered_edges = 0                  # most number of uncovered edges covered with a biclique
+            if not heap:
+                push_samples(k)
 
-        for e in E_sample:
+            _, _, e = heappop(heap)
+            queued.discard(e)
+            if e not in E:
+                continue                        # seed got covered, its biclique is not a candidate anymore
 
-            u, v = e.vertices()
-            L = uncovered_neighbors(u)
-            R = uncovered_neighbors(v) - L
+            L, R, covered_edges = evaluate(e)
+            if heap and (covered_edges < -heap[0][0]):
+                queued.add(e)
+                heappush(heap, (-covered_edges, next(tiebreak), e))     # stale, try again later
+                continue
 
-            # loop until convergence on biclique
-            while L and R:
-                L_old, R_old = L, R
-                L = set.intersection(*[uncovered_neighbors(v) for v in R])
-                R = set.intersection(*[uncovered_neighbors(v) for v in L]) - L
-                if (L_old == L) and (R_old == R):
-                    break
+            cover(E, N, L, R)           # remove edges that are now covered by L x R
+            if cache is not None:
+                cache.invalidate(L, R)
+            tally["rounds"] += 1
 
-            b = CompleteBipartiteGraph(L, R)
-            covered_edges = len(E.intersection(set(b.C.keys())))
-            if (covered_edges > most_covered_edges):
-                B = b
-                most_covered_edges = covered_edges
-        
-        E -= set(B.C.keys())        # remove edges that are now covered by B
+            yield Biclique(L, R)
 
-        yield B
+            if len(E) > 0:
+                push_samples(k if (len(E) <= k) else refresh)     # like the eager version, look at every edge at the tail
+    finally:
+        instrument.add_counts(tally)
 
 
 def approx_biclique_cover_number(G : Graph, k : Optional[int] = None) -> int:
@@ -0,0 +1,309 @@
+"""Benchmark history and regression checks.
+
+Every recorded benchmark run is appended to a JSONL file, one line per
+(solver, dataset) cell, together with the git revision and the machine it
+ran on, so results can be compared across commits instead of pasting
+tables into the README.
+
+    record:   runs benchmark.py (any benchmark options after --) and appends
+              the results; before anything is reported or stored, the exact
+              solvers must agree on k for every dataset and no solver may
+              report a k below the exact one
+    compare:  compares one recorded run with a baseline run; a cell is a
+              regression if it got slower (one-sided Mann-Whitney U test on
+              the run times, p < --alpha, and the median grew by more than
+              --min-change), if its k got worse, or if it stopped finishing
+    list:     lists the recorded runs
+
+record and compare exit with 1 on a regression or a wrong k, so they can be
+used as a gate.
+
+Usage (from src/):
+    python bench_history.py record -- --solvers tate_greedy jared_search --repeat 10
+    python bench_history.py compare --baseline <run id or git revision>
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+
+import benchmark
+import solvers
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_history.jsonl")
+
+
+def git_revision():
+    """Short hash of HEAD, with '-dirty' if the tree has uncommitted changes ('unknown' outside git)."""
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True,
+                             text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=cwd).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def machine_info():
+    return {
+        "node": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def check_results(records):
+    """
+    Cross-checks k on every dataset: all exact solvers that finished must
+    agree, no solver may report a smaller k than they did (a smaller cover
+    than the minimum means a bug), and k must fit the dataset's known bounds.
+    Returns a list of problems.
+    """
+    problems = []
+    by_dataset = {}
+    for record in records:
+        if record["status"] == "ok" and record["k"] is not None:
+            by_dataset.setdefault(record["dataset"], []).append(record)
+    for dataset, cell_records in by_dataset.items():
+        exact = {r["solver"]: r["k"] for r in cell_records if solvers.SOLVERS[r["solver"]].exact}
+        if len(set(exact.values())) > 1:
+            problems.append(f"{dataset}: exact solvers disagree on k ({exact})")
+            continue
+        if exact:
+            k = next(iter(exact.values()))
+            for r in cell_records:
+                if r["k"] < k:
+                    problems.append(f"{dataset}: {r['solver']} reports k={r['k']} below the exact k={k}")
+        for r in cell_records:
+            if r["valid"] is False:
+                problems.append(f"{dataset}: {r['solver']} returned an invalid cover")
+            if not benchmark.within_bounds(r, solvers.SOLVERS[r["solver"]].exact):
+                problems.append(f"{dataset}: {r['solver']} reports k={r['k']} outside the known bounds "
+                                f"[{r['lower']}, {r['upper']}]")
+    return problems
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path, records, meta):
+    """Appends one line per cell, all under a new run id; returns the run id."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    run_id = now.strftime("%Y%m%dT%H%M%S%fZ")
+    rev = git_revision()
+    machine = machine_info()
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps({"run_id": run_id, "date": now.isoformat(), "git_rev": rev, "machine": machine,
+                                "meta": meta, **record}) + "\n")
+    return run_id
+
+
+def runs(history):
+    """Run ids in recording order, with their git revision and date."""
+    seen = {}
+    for line in history:
+        seen.setdefault(line["run_id"], (line["git_rev"], line["date"]))
+    return seen
+
+
+def select_run(history, key, default_index):
+    """
+    A run id, a git revision (prefix, the latest run of it) or None for
+    runs[default_index]. Returns the run id.
+    """
+    ids = list(runs(history))
+    if not ids:
+        raise SystemExit("history is empty, record a run first")
+    if key is None:
+        if len(ids) < abs(default_index):
+            raise SystemExit("not enough recorded runs to compare")
+        return ids[default_index]
+    if key in ids:
+        return key
+    matching = [run_id for run_id, (rev, _) in runs(history).items() if rev.startswith(key)]
+    if not matching:
+        raise SystemExit(f"no recorded run with id or git revision '{key}'")
+    return matching[-1]
+
+
+def mann_whitney_greater(sample, reference):
+    """
+    One-sided Mann-Whitney U test that sample tends to be larger than
+    reference, using the normal approximation with tie and continuity
+    corrections. Returns the p-value (1.0 if either sample is empty).
+    With only a few runs per side even a complete separation gives a large
+    p-value (about 0.04 for 3 vs 3), so use --repeat 5 or more for a gate.
+    """
+    n1, n2 = len(sample), len(reference)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    pooled = sorted([(x, 0) for x in sample] + [(x, 1) for x in reference])
+    n = n1 + n2
+    ranks_1 = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1          # average rank of the tied block
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        ranks_1 += rank * sum(1 for t in range(i, j + 1) if pooled[t][1] == 0)
+        i = j + 1
+    u = ranks_1 - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(history, baseline_id, candidate_id, alpha=0.05, min_change=0.10):
+    """
+    Compares the cells of two runs. Returns a list of rows
+    (solver, dataset, baseline median, candidate median, change, p, verdict)
+    and whether any row is a regression.
+    """
+    baseline = {(r["solver"], r["dataset"]): r for r in history if r["run_id"] == baseline_id}
+    candidate = {(r["solver"], r["dataset"]): r for r in history if r["run_id"] == candidate_id}
+    rows = []
+    regression = False
+    for key in sorted(candidate):
+        new = candidate[key]
+        old = baseline.get(key)
+        p, change = None, None
+        if old is None:
+            verdict = "new"
+        elif old["status"] == "ok" and new["status"] != "ok":
+            verdict = new["status"].upper()
+            regression = True
+        elif new["status"] != "ok":
+            verdict = f"{new['status']} (was {old['status']})"
+        elif old["status"] != "ok":
+            verdict = "fixed"
+        elif (old["k"] is not None) and (new["k"] is None or new["k"] > old["k"]):
+            verdict = f"WORSE k ({old['k']} -> {new['k']})"
+            regression = True
+        else:
+            change = new["median"] / old["median"] - 1 if old["median"] else 0.0
+            p = mann_whitney_greater(new["times"], old["times"])
+            if p < alpha and change > min_change:
+                verdict = "SLOWER"
+                regression = True
+            elif mann_whitney_greater(old["times"], new["times"]) < alpha and change < -min_change:
+                verdict = "faster"
+            else:
+                verdict = "same"
+            if new["k"] is not None and old["k"] is not None and new["k"] < old["k"]:
+                verdict += f", better k ({old['k']} -> {new['k']})"
+        rows.append((key[0], key[1], old and old["median"], new["median"], change, p, verdict))
+    return rows, regression
+
+
+def format_seconds(value):
+    return "-" if value is None else f"{value:.6f}s"
+
+
+def command_record(args, benchmark_argv):
+    bench_args = benchmark.parse_args(benchmark_argv)
+    records, meta = benchmark.run(bench_args)
+
+    problems = check_results(records)
+    if problems:
+        print("Not recording, the solvers do not agree on k:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+
+    benchmark.print_header()
+    for record in records:
+        print(benchmark.format_row(record))
+    benchmark.print_footer(records, meta)
+    run_id = append_history(args.history, records, meta)
+    print(f"recorded run {run_id} ({git_revision()}) in {args.history}")
+    return 0
+
+
+def command_compare(args):
+    history = load_history(args.history)
+    candidate_id = select_run(history, args.candidate, -1)
+    if args.baseline is None:
+        ids = list(runs(history))
+        if ids.index(candidate_id) == 0:
+            raise SystemExit("the candidate is the first recorded run, there is no baseline to compare with")
+        baseline_id = ids[ids.index(candidate_id) - 1]
+    else:
+        baseline_id = select_run(history, args.baseline, -2)
+    revs = runs(history)
+    print(f"baseline:  {baseline_id} ({revs[baseline_id][0]})")
+    print(f"candidate: {candidate_id} ({revs[candidate_id][0]})")
+
+    rows, regression = compare(history, baseline_id, candidate_id, args.alpha, args.min_change)
+    print(f"{'ALGORITHM':<16} | {'DATASET':<20} | {'BASELINE':<12} | {'CANDIDATE':<12} | {'CHANGE':<8} | "
+          f"{'P':<6} | VERDICT")
+    print("-" * 110)
+    for solver, dataset, old, new, change, p, verdict in rows:
+        change_text = "-" if change is None else f"{change:+.1%}"
+        p_text = "-" if p is None else f"{p:.3f}"
+        print(f"{solver:<16} | {dataset:<20} | {format_seconds(old):<12} | {format_seconds(new):<12} | "
+              f"{change_text:<8} | {p_text:<6} | {verdict}")
+    print("-" * 110)
+    print("REGRESSION" if regression else "no regressions")
+    return 1 if regression else 0
+
+
+def command_list(args):
+    history = load_history(args.history)
+    cells = {}
+    for line in history:
+        cells[line["run_id"]] = cells.get(line["run_id"], 0) + 1
+    for run_id, (rev, date) in runs(history).items():
+        print(f"{run_id}  {rev:<16} {date}  {cells[run_id]} cells")
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    benchmark_argv = []
+    if "--" in argv:
+        benchmark_argv = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+
+    parser = argparse.ArgumentParser(description="Record benchmark runs and compare them for regressions.")
+    parser.add_argument("--history", default=HISTORY_PATH, help=f"history file (default: {HISTORY_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("record", help="run benchmark.py (options after --) and append the results")
+    compare_parser = commands.add_parser("compare", help="compare a run with a baseline run")
+    compare_parser.add_argument("--baseline", help="run id or git revision (default: the run before the candidate)")
+    compare_parser.add_argument("--candidate", help="run id or git revision (default: the latest run)")
+    compare_parser.add_argument("--alpha", type=float, default=0.05, help="significance level (default: 0.05)")
+    compare_parser.add_argument("--min-change", type=float, default=0.10,
+                                help="smallest relative slowdown of the median that counts (default: 0.10)")
+    commands.add_parser("list", help="list the recorded runs")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        return command_record(args, benchmark_argv)
+    if args.command == "compare":
+        return command_compare(args)
+    return command_list(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""Benchmark harness for the solvers in solvers.SOLVERS.
+
+Every (solver, dataset) cell runs in its own child process: warmup runs
+first (not reported), then the timed repetitions, each sent back to the
+parent as soon as it finishes. If a single run takes longer than the
+timeout the child is killed and the cell is reported as a timeout, so one
+slow cell (e.g. the SAT solver on Crown_S11) cannot block the table.
+Only the solve phase of SolveResult.timings is reported; the Instance is
+built once per cell, outside the timed region. The counters of each cell's
+last timed run (see instrument.py) are kept in its record, and --trace
+writes the phases of those runs as one Chrome trace, a process per cell.
+
+    latency mode:     cells run one after another (default)
+    throughput mode:  up to --workers cells run at the same time, and the
+                      total number of runs per second is reported as well
+
+Usage (from src/):
+    python benchmark.py --solvers tate_greedy jared_matrix --datasets Crown_S8 Crown_S9 --repeat 10 --timeout 30
+    python benchmark.py --mode throughput --workers 4 --json results.json --csv results.csv
+    python benchmark.py --groups scale --solvers tate_optimized jared_search --trace trace.json
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from multiprocessing.connection import wait
+
+import datasets as registry
+import solvers
+from cover_verifier import verify_cover
+
+FIELDS = ["solver", "dataset", "status", "k", "valid", "lower", "upper", "runs", "median", "p95", "stdev", "min",
+          "mean", "error"]
+DEFAULT_GROUPS = ["toy", "test", "difficult"]
+
+
+def percentile(values, q):
+    """Nearest-rank percentile (q in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))     # ceil(n * q / 100)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(times):
+    """Timing statistics of the timed runs of one cell (seconds)."""
+    if not times:
+        return {"runs": 0, "median": None, "p95": None, "stdev": None, "min": None, "mean": None}
+    return {
+        "runs": len(times),
+        "median": statistics.median(times),
+        "p95": percentile(times, 95),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "min": min(times),
+        "mean": statistics.mean(times),
+    }
+
+
+def _cell_worker(conn, solver_name, dataset_name, warmup, repeat, max_k, seed):
+    """
+    Child process of one cell. Sends ("run", warmup?, solve time, k, valid,
+    counters, trace events) after every run, ("error", message) if the
+    solver raises, and ("done",) at the end.
+    """
+    solver = solvers.SOLVERS[solver_name]
+    instance = solvers.Instance(registry.get(dataset_name), dataset_name)
+    budget = solvers.Budget(max_k=max_k, seed=seed)
+    for i in range(warmup + repeat):
+        try:
+            result = solver.solve(instance, budget)
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+            conn.close()
+            return
+        valid = None if result.cover is None else bool(verify_cover(instance.edges, result.cover))
+        conn.send(("run", i < warmup, result.timings["solve"], result.k, valid, result.stats,
+                   result.instrument.trace_events()))
+    conn.send(("done",))
+    conn.close()
+
+
+class _Cell:
+
+    def __init__(self, solver_name, dataset_name):
+        self.solver = solver_name
+        self.dataset = dataset_name
+        self.status = "ok"
+        self.times = []
+        self.k = None
+        self.valid = None
+        self.error = None
+        self.counters = {}
+        self.trace = []
+        self.process = None
+        self.conn = None
+        self.last_message = None
+
+    def record(self):
+        entry = registry.dataset(self.dataset)
+        return {
+            "solver": self.solver,
+            "dataset": self.dataset,
+            "status": self.status,
+            "k": self.k,
+            "valid": self.valid,
+            "lower": entry.lower,
+            "upper": entry.upper,
+            **summarize(self.times),
+            "error": self.error,
+            "times": list(self.times),
+            "counters": self.counters,
+        }
+
+
+def run_benchmark(solver_names, dataset_names, warmup=1, repeat=5, timeout=60.0, workers=1, max_k=15, seed=0,
+                  progress=None, trace=None):
+    """
+    Runs every solver on every dataset of the registry in dataset_names and
+    returns (records, wall seconds). Cells are run by up to `workers` child
+    processes at a time, each generating (or loading) its dataset itself;
+    progress(record) is called as each cell finishes. If a list is passed as
+    trace, the Chrome trace events of each cell's last timed run are added.
+    """
+    pending = [_Cell(solver_name, dataset_name) for solver_name in solver_names for dataset_name in dataset_names]
+    pending.reverse()
+    running = []
+    records = []
+    start = time.perf_counter()
+
+    def finish(cell, status=None):
+        if status is not None:
+            cell.status = status
+        cell.conn.close()
+        cell.process.join(timeout=1.0)
+        if cell.process.is_alive():
+            cell.process.kill()
+            cell.process.join()
+        running.remove(cell)
+        records.append(cell.record())
+        if trace is not None:
+            trace.extend(cell.trace)
+        if progress is not None:
+            progress(records[-1])
+
+    while pending or running:
+        while pending and len(running) < workers:
+            cell = pending.pop()
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+            cell.conn = parent_conn
+            cell.process = multiprocessing.Process(
+                target=_cell_worker, daemon=True,
+                args=(child_conn, cell.solver, cell.dataset, warmup, repeat, max_k, seed))
+            cell.process.start()
+            child_conn.close()
+            cell.last_message = time.perf_counter()
+            running.append(cell)
+
+        # wake up for the first message, or when the oldest run in progress reaches the timeout
+        now = time.perf_counter()
+        wait_time = None if timeout is None else max(0.0, min(c.last_message + timeout for c in running) - now)
+        ready = wait([c.conn for c in running], timeout=wait_time)
+
+        for cell in list(running):
+            if cell.conn in ready:
+                try:
+                    message = cell.conn.recv()
+                except EOFError:
+                    cell.error = f"worker exited with code {cell.process.exitcode}"
+                    finish(cell, "error")
+                    continue
+                cell.last_message = time.perf_counter()
+                if message[0] == "run":
+                    _, is_warmup, solve_time, cell.k, cell.valid, counters, events = message
+                    if not is_warmup:
+                        cell.times.append(solve_time)
+                        cell.counters, cell.trace = counters, events
+                elif message[0] == "error":
+                    cell.error = message[1]
+                    finish(cell, "error")
+                else:
+                    finish(cell)
+            elif (timeout is not None) and (time.perf_counter() - cell.last_message > timeout):
+                cell.process.kill()
+                finish(cell, "timeout")
+
+    return records, time.perf_counter() - start
+
+
+def within_bounds(record, exact=False):
+    """False if k contradicts the dataset's known bounds (above upper only counts for exact solvers)."""
+    k = record["k"]
+    if k is None or record["lower"] is None:
+        return True
+    return k >= record["lower"] and (not exact or record["upper"] is None or k <= record["upper"])
+
+
+def format_row(record):
+    k = "-" if record["k"] is None else record["k"]
+    if record["status"] != "ok":
+        timing = f"{record['status'].upper():<12}"
+        return (f"{record['solver']:<16} | {record['dataset']:<20} | {timing} | {'':<12} | {'':<10} | {'':<12} | "
+                f"k={k:<6} | {record['error'] or ''}")
+    valid = "n/a" if record["valid"] is None else ("ok" if record["valid"] else "INVALID")
+    if not within_bounds(record, solvers.SOLVERS[record["solver"]].exact):
+        valid += f", k outside known bounds [{record['lower']}, {record['upper']}]"
+    return (f"{record['solver']:<16} | {record['dataset']:<20} | {record['median']:.6f}s    | "
+            f"{record['p95']:.6f}s    | {record['stdev']:.6f}  | {record['min']:.6f}s    | k={k:<6} | {valid}")
+
+
+def write_json(path, records, meta):
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": records}, f, indent=2)
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow({field: record[field] for field in FIELDS})
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the biclique cover solvers on the repo's datasets.")
+    parser.add_argument("--solvers", nargs="+", default=list(solvers.SOLVERS), choices=list(solvers.SOLVERS),
+                        help="solvers to run (default: all)")
+    parser.add_argument("--datasets", nargs="+", default=None,
+                        help="datasets to run (default: every dataset of --groups)")
+    parser.add_argument("--groups", nargs="+", default=DEFAULT_GROUPS, choices=registry.groups(),
+                        help=f"dataset groups to run (default: {' '.join(DEFAULT_GROUPS)})")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before the timed ones (default: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per cell (default: 5)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per run, 0 for none (default: 60)")
+    parser.add_argument("--mode", choices=["latency", "throughput"], default="latency",
+                        help="latency: one cell at a time; throughput: --workers cells in parallel")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="parallel cells in throughput mode (default: number of cores)")
+    parser.add_argument("--max-k", type=int, default=15, help="largest k for the exact SAT solver (default: 15)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the randomized heuristics (default: 0)")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    parser.add_argument("--trace", help="also write the phases of each cell's last run to this Chrome trace file")
+    return parser.parse_args(argv)
+
+
+def run(args, progress=None):
+    """
+    Runs the benchmark described by parsed arguments (see parse_args) and
+    returns (records, meta).
+    """
+    names = registry.names(*args.groups) if args.datasets is None else args.datasets
+    unknown = [name for name in names if name not in registry.REGISTRY]
+    if unknown:
+        raise SystemExit(f"unknown dataset(s): {', '.join(unknown)}; available: {', '.join(registry.names())}")
+    workers = 1 if args.mode == "latency" else max(1, args.workers)
+    trace = [] if args.trace else None
+    records, wall = run_benchmark(args.solvers, names, warmup=args.warmup, repeat=args.repeat,
+                                  timeout=args.timeout or None, workers=workers, max_k=args.max_k, seed=args.seed,
+                                  progress=progress, trace=trace)
+    if args.trace:
+        with open(args.trace, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+    meta = {"mode": args.mode, "workers": workers, "warmup": args.warmup, "repeat": args.repeat,
+            "timeout": args.timeout, "max_k": args.max_k, "seed": args.seed, "wall": wall}
+    return records, meta
+
+
+def print_header():
+    print(f"{'ALGORITHM':<16} | {'DATASET':<20} | {'MEDIAN (s)':<12} | {'P95 (s)':<12} | {'STDEV':<10} | "
+          f"{'MIN (s)':<12} | {'RESULT':<8} | COVER")
+    print("-" * 120)
+
+
+def print_footer(records, meta):
+    print("-" * 120)
+    total_runs = sum(record["runs"] for record in records)
+    print(f"{len(records)} cells, {total_runs} timed runs in {meta['wall']:.3f}s wall "
+          f"({meta['mode']}, {meta['workers']} worker(s))")
+    if meta["mode"] == "throughput":
+        print(f"throughput: {total_runs / meta['wall']:.2f} runs/s")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print_header()
+    records, meta = run(args, progress=lambda record: print(format_row(record), flush=True))
+    print_footer(records, meta)
+    if args.json:
+        write_json(args.json, records, meta)
+    if args.csv:
+        write_csv(args.csv, records)
+    return records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compact |U| x |V| biadjacency matrices for the matrix-based solvers.
+
+U and V vertex ids are remapped separately to 0..|U|-1 and 0..|V|-1, and
+every row is a Python int with bit j set if the row's U vertex is adjacent
+to V vertex j. Memory is at most |U|*|V|/8 bytes (less for sparse rows),
+independent of how large the vertex ids are.
+"""
+
+
+class Biadjacency:
+
+    def __init__(self, edges):
+        """
+        Builds the matrix from (u, v) edges, U vertex first (the convention
+        of every dataset in the repo). Duplicate edges are ignored. U and V
+        ids are remapped separately, so the same id may name a U and a V
+        vertex.
+        """
+        edges = [tuple(edge) for edge in edges]
+        self.row_labels = sorted({u for u, _ in edges})     # row i    -> U vertex id
+        self.col_labels = sorted({v for _, v in edges})     # column j -> V vertex id
+        self.row_index = {u: i for i, u in enumerate(self.row_labels)}
+        self.col_index = {v: j for j, v in enumerate(self.col_labels)}
+
+        self.rows = [0] * len(self.row_labels)
+        for u, v in edges:
+            self.rows[self.row_index[u]] |= 1 << self.col_index[v]
+
+    @classmethod
+    def from_graph(cls, G):
+        """Builds the matrix of a BipartiteGraph, rows = G.U, columns = G.V."""
+        if not hasattr(G, "U"):
+            raise ValueError("Input graph is not bipartite")
+        edges = []
+        for e in G.C.keys():
+            u, v = e.vertices()
+            edges.append((u, v) if u in G.U else (v, u))
+        return cls(edges)
+
+    @property
+    def num_rows(self):
+        return len(self.rows)
+
+    @property
+    def num_cols(self):
+        return len(self.col_labels)
+
+    @property
+    def m(self):
+        return sum(bin(row).count("1") for row in self.rows)
+
+    def has_edge(self, u, v):
+        i, j = self.row_index.get(u), self.col_index.get(v)
+        return i is not None and j is not None and bool((self.rows[i] >> j) & 1)
+
+    def edges(self):
+        """Yields the (u, v) edges in original ids."""
+        for i, row in enumerate(self.rows):
+            while row:
+                low_bit = row & -row
+                yield self.row_labels[i], self.col_labels[low_bit.bit_length() - 1]
+                row ^= low_bit
+
+    def to_dense(self):
+        """|U| x |V| list of 0/1 lists, for code that still wants a plain matrix."""
+        return [[(row >> j) & 1 for j in range(self.num_cols)] for row in self.rows]
+
+    def __repr__(self):
+        return f"Biadjacency(|U|={self.num_rows}, |V|={self.num_cols}, m={self.m})"
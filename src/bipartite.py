@@ -1,5 +1,5 @@
 
-from typing import Set, Dict, Iterator, Optional, Literal, Type
+from typing import Set, Dict, Iterator, Iterable, Optional, Literal, Type, FrozenSet, Tuple
 from graph import Graph
 
 
@@ -174,3 +174,58 @@ class CompleteBipartiteGraph(BipartiteGraph):
             V = set(map(int, f.readline().strip().split()))
             return CompleteBipartiteGraph(U, V)
 
+
+
+class Biclique:
+    # compact record of a complete bipartite subgraph: only the two vertex sets are stored, the |U| * |V| edges are implied;
+    # CompleteBipartiteGraph objects (which build every edge) are made on demand with to_complete_bipartite_graph()
+
+    __slots__ = ("_U", "_V", "_m")
+
+    def __init__(self, U: Iterable[int], V: Iterable[int]) -> None:
+        self._U : FrozenSet[int] = frozenset(U)
+        self._V : FrozenSet[int] = frozenset(V)
+        self._m : Optional[int] = None
+        if len(self._U.intersection(self._V)) > 0:
+            raise ValueError("U and V are not independent")
+
+    @property
+    def U(self) -> FrozenSet[int]:
+        return self._U
+
+    @property
+    def V(self) -> FrozenSet[int]:
+        return self._V
+
+    @property
+    def n(self) -> int:
+        return len(self._U) + len(self._V)
+
+    @property
+    def m(self) -> int:
+        # number of edges, counted on first use
+        if self._m is None:
+            self._m = len(self._U) * len(self._V)
+        return self._m
+
+    def covers(self, u: int, v: int) -> bool:
+        return ((u in self._U) and (v in self._V)) or ((u in self._V) and (v in self._U))
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        for u in self._U:
+            for v in self._V:
+                yield (u, v)
+
+    def to_complete_bipartite_graph(self) -> CompleteBipartiteGraph:
+        return CompleteBipartiteGraph(set(self._U), set(self._V))
+
+    def __eq__(self, obj: object) -> bool:
+        if isinstance(obj, Biclique):
+            return ((self.U == obj.U) and (self.V == obj.V)) or ((self.U == obj.V) and (self.V == obj.U))
+        return False
+
+    def __hash__(self) -> int:
+        return hash(frozenset((self._U, self._V)))
+
+    def __repr__(self) -> str:
+        return f"Biclique(U={sorted(self._U)}, V={sorted(self._V)})"
@@ -0,0 +1,155 @@
+
+from typing import Generator, Optional, List, Tuple
+from graph import Graph
+from bipartite import Biclique
+from approx_biclique_cover import UncoveredEdges, edge_key
+from instrument import NULL
+from math import isqrt
+import random
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: Library 'numpy' is missing.")
+    print("Please install it running: pip install numpy")
+    sys.exit(1)
+
+
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+if hasattr(np, "bitwise_count"):
+    def popcount(a: "np.ndarray") -> "np.ndarray":
+        # number of set bits in every uint64 word
+        return np.bitwise_count(a)
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(a: "np.ndarray") -> "np.ndarray":
+        # number of set bits in every uint64 word (byte lookup table for NumPy < 2.0)
+        return _BYTE_COUNTS[a.view(np.uint8)].reshape(*a.shape, 8).sum(axis=-1, dtype=np.uint8)
+
+
+class BitsetIndex:
+    # uncovered adjacency as an n x W matrix of uint64 words, row v = bit set of the uncovered neighbors of v
+
+    def __init__(self, G: Graph) -> None:
+        self.vertices : List[int] = sorted(G.vertices())
+        self.index = {v: i for i, v in enumerate(self.vertices)}
+        self.n = len(self.vertices)
+        self.words = max(1, (self.n + 63) // 64)
+        self.A = np.zeros((self.n, self.words), dtype=np.uint64)
+        self.E = UncoveredEdges()               # uncovered edges, as pairs of row indices
+        for e in G.C.keys():
+            u, v = (self.index[w] for w in e.vertices())
+            if u != v:
+                self.A[u, v >> 6] |= np.uint64(1 << (v & 63))
+                self.A[v, u >> 6] |= np.uint64(1 << (u & 63))
+                self.E.add(edge_key(u, v))
+
+    def members(self, rows: "np.ndarray") -> "np.ndarray":
+        # B x W bit sets -> B x n booleans
+        bits = np.unpackbits(rows.view(np.uint8), axis=-1, bitorder="little")
+        return bits[..., :self.n].astype(bool)
+
+    def _and_rows(self, selected: "np.ndarray") -> "np.ndarray":
+        # for every set in the batch, the AND of the rows it selects (all ones for an empty selection);
+        # only rows selected by some set of the batch take part
+        rows = np.flatnonzero(selected.any(axis=0))
+        stacked = np.where(selected[:, rows, None], self.A[None, rows, :], ALL_ONES)
+        return np.bitwise_and.reduce(stacked, axis=1)
+
+    def converge(self, seeds: List[Tuple[int, int]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        # the convergence loop of approx_biclique_cover for a batch of seed edges at once
+        U = np.array([u for u, _ in seeds])
+        V = np.array([v for _, v in seeds])
+        L = self.A[U].copy()
+        R = self.A[V] & ~L
+        active = L.any(axis=1) & R.any(axis=1)
+        while active.any():
+            L_new = self._and_rows(self.members(R[active]))
+            R_new = self._and_rows(self.members(L_new)) & ~L_new
+            changed = (L_new != L[active]).any(axis=1) | (R_new != R[active]).any(axis=1)
+            L[active], R[active] = L_new, R_new
+            still_active = np.flatnonzero(active)[changed]
+            active[:] = False
+            active[still_active] = True
+            active &= L.any(axis=1) & R.any(axis=1)
+        return L, R
+
+    def uncovered_counts(self, L: "np.ndarray", R: "np.ndarray") -> "np.ndarray":
+        # popcount of the submatrix rows(L) x columns(R) of the uncovered adjacency, per biclique in the batch;
+        # converge() only stops at a fixed point, where that submatrix is all ones, so the popcount is |L| * |R|
+        sizes_L = popcount(L).sum(axis=1, dtype=np.int64)
+        sizes_R = popcount(R).sum(axis=1, dtype=np.int64)
+        return sizes_L * sizes_R
+
+    def cover(self, L_bits: "np.ndarray", R_bits: "np.ndarray") -> None:
+        L_rows = np.flatnonzero(self.members(L_bits[None, :])[0])
+        R_rows = np.flatnonzero(self.members(R_bits[None, :])[0])
+        removed = self.members(self.A[L_rows] & R_bits)
+        # in edge_key order, like approx_biclique_cover.cover (rows are in vertex order), so E stays in the same order
+        for e in sorted(edge_key(int(L_rows[i]), int(w)) for i, w in zip(*np.nonzero(removed))):
+            self.E.discard(e)
+        self.A[L_rows] &= ~R_bits
+        self.A[R_rows] &= ~L_bits
+
+    def to_vertices(self, bits: "np.ndarray") -> set:
+        return {self.vertices[i] for i in np.flatnonzero(self.members(bits[None, :])[0])}
+
+
+def bitset_approx_biclique_cover(G: Graph, k: Optional[int] = None, rng: Optional[random.Random] = None,
+                                 batch_size: Optional[int] = None, instrument=None) -> Generator[Biclique, None, None]:
+    # approx_biclique_cover on a bit-packed NumPy adjacency: the intersections over L or R are one bitwise_and.reduce,
+    # coverage counts are popcounts, and the samples of a round are converged together in batches of batch_size
+    # (default: as many as fit in about 64 MB of temporaries). Samples, ties and the order covered edges leave the
+    # uncovered set are the same as in approx_biclique_cover, so both give the same cover for the same seed.
+    # Passing an instrument.Instrument collects the index / evaluate / cover phase times and the rounds and samples
+
+    instrument = NULL if (instrument is None) else instrument
+    with instrument.phase("index"):
+        index = BitsetIndex(G)
+    k = isqrt(G.m)+1 if (k is None) else k      # number of samples
+    rng = random if (rng is None) else rng
+    if batch_size is None:
+        batch_size = max(1, (64 << 20) // (8 * index.n * index.words))
+    E = index.E
+    tally = {"rounds": 0, "samples": 0}         # reported to the instrument once, at the end
+
+    try:
+        while len(E) > 0:
+
+            with instrument.phase("evaluate"):
+                E_sample = list(E) if (len(E) <= k) else E.sample(k, rng)
+                most_covered_edges = 0
+                best = None
+
+                for start in range(0, len(E_sample), batch_size):
+                    L, R = index.converge(E_sample[start:start+batch_size])
+                    counts = index.uncovered_counts(L, R)
+                    i = int(np.argmax(counts))          # first maximum, i.e. the lowest sample index on ties
+                    if counts[i] > most_covered_edges:
+                        most_covered_edges = int(counts[i])
+                        best = (L[i].copy(), R[i].copy())
+            tally["rounds"] += 1
+            tally["samples"] += len(E_sample)
+
+            if best is None:
+                # backup biclique in case loop results in empty graph, so algorithm always makes progress
+                u, v = next(iter(E))
+                best = (np.zeros(index.words, dtype=np.uint64), np.zeros(index.words, dtype=np.uint64))
+                best[0][u >> 6] |= np.uint64(1 << (u & 63))
+                best[1][v >> 6] |= np.uint64(1 << (v & 63))
+
+            with instrument.phase("cover"):
+                L_bits, R_bits = best
+                B = Biclique(index.to_vertices(L_bits), index.to_vertices(R_bits))
+                index.cover(L_bits, R_bits)
+
+            yield B
+    finally:
+        instrument.add_counts(tally)
+
+
+def bitset_approx_biclique_cover_number(G : Graph, k : Optional[int] = None) -> int:
+    return sum(1 for _ in bitset_approx_biclique_cover(G, k))
@@ -0,0 +1,94 @@
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Checks that a list of bicliques covers exactly the edges of a graph: every edge lies in some biclique and no
+# biclique uses a non-edge. Adjacency rows and coverage rows are Python ints used as bit sets over the vertices, so
+# a biclique L x R costs |L| + |R| row operations instead of |L| * |R| edge lookups.
+
+
+Edge = Tuple[int, int]
+
+
+class CoverVerdict:
+
+    def __init__(self, reason : Optional[str] = None, edge : Optional[Edge] = None, biclique : Optional[int] = None) -> None:
+        self._reason = reason           # None, "non-edge" or "uncovered"
+        self._edge = edge
+        self._biclique = biclique       # index in the cover of the biclique that uses the non-edge
+
+    @property
+    def ok(self) -> bool:
+        return self._reason is None
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    @property
+    def edge(self) -> Optional[Edge]:
+        # first offending edge, None if the cover is exact
+        return self._edge
+
+    @property
+    def biclique(self) -> Optional[int]:
+        return self._biclique
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return "CoverVerdict(ok)"
+        if self._reason == "non-edge":
+            return f"CoverVerdict(biclique {self._biclique} uses non-edge {self._edge})"
+        return f"CoverVerdict(edge {self._edge} is not covered)"
+
+
+def edge_pairs(G) -> Iterable[Edge]:
+    # accepts a list of (u, v) pairs or a Graph (anything with edge keys in G.C)
+    if hasattr(G, "C"):
+        return (tuple(e.vertices()) for e in G.C.keys())
+    return (tuple(e) for e in G)
+
+
+def verify_cover(G, cover : Iterable) -> CoverVerdict:
+    # cover: bicliques with .U and .V (Biclique, CompleteBipartiteGraph, ...); the side of U and V does not matter
+
+    index : Dict[int, int] = {}
+    vertices : List[int] = []
+
+    def bit(v : int) -> int:
+        if v not in index:
+            index[v] = len(vertices)
+            vertices.append(v)
+            rows.append(0)
+            covered.append(0)
+        return index[v]
+
+    rows : List[int] = []           # rows[i]: neighbors of vertex i
+    covered : List[int] = []        # covered[i]: neighbors j of vertex i with (i, j) in some biclique
+    for u, v in edge_pairs(G):
+        i, j = bit(u), bit(v)
+        rows[i] |= 1 << j
+        rows[j] |= 1 << i
+
+    for b, B in enumerate(cover):
+        L = [bit(u) for u in B.U]
+        R = [bit(v) for v in B.V]
+        mask_L = sum(1 << i for i in L)
+        mask_R = sum(1 << j for j in R)
+        for i in L:
+            bad = mask_R & ~rows[i]
+            if bad:
+                j = (bad & -bad).bit_length() - 1
+                return CoverVerdict("non-edge", (vertices[i], vertices[j]), b)
+            covered[i] |= mask_R
+        for j in R:
+            covered[j] |= mask_L
+
+    for i, row in enumerate(rows):
+        missing = row & ~covered[i]
+        if missing:
+            j = (missing & -missing).bit_length() - 1
+            return CoverVerdict("uncovered", (vertices[i], vertices[j]))
+    return CoverVerdict()
@@ -1,104 +1,152 @@
-#import difficult_datasets as dd
+import heapq
+from bipartite import Biclique
+from instrument import NULL
 
-def recursive_search(list_of_edges):
+# Growing a seed edge (u, v) into a maximal biclique of the remaining edges
+# always ends at U = N(v), V = every v' with N(v') containing N(v): adding U
+# vertices needs a neighbor of v, and that U side fixes the V side. So the
+# result only depends on the neighborhood of the seed's v, and seeds are
+# deduplicated by it instead of being expanded one by one.
+
+
+def mask_vertices(bits, u_bit):
+    """Yields the U vertices whose bits are set in bits."""
+    while bits:
+        low_bit = bits & -bits
+        yield u_bit[low_bit.bit_length() - 1]
+        bits ^= low_bit
+
+
+def expand_neighborhood(v_start, v_masks, u_neighbors, u_bit):
+    """
+    Expands the seed v_start with bitmask subset tests: N(v) of every V
+    vertex is packed into an int over U, and N(v') contains N(v_start) iff
+    N(v') & mask == mask. Candidates for v' only have to come from the
+    smallest neighborhood of a U vertex in N(v_start).
+    Returns (U_set, V_set).
+    """
+    mask = v_masks[v_start]
+    U_set = set(mask_vertices(mask, u_bit))
+    fewest = min(U_set, key=lambda u: len(u_neighbors[u]))
+    V_set = {v for v in u_neighbors[fewest] if v_masks[v] & mask == mask}
+    return U_set, V_set
+
+
+def recursive_search(list_of_edges, stats=None, instrument=None):
     """
-    Recursively finds the minimum biclique cover for the given edges.
+    Finds a biclique cover for the given edges.
     The Bipartite Dimension Problem seeks to find the minimum number of 
     complete bipartite subgraphs (bicliques) needed to cover all edges.
     
-    Strategy: Find the largest biclique, remove it, then recursively process remaining edges.
+    Strategy: Find the largest biclique, remove it, then repeat on the remaining edges.
+    (This used to recurse once per biclique; it is now a loop, so covers with
+    thousands of bicliques do not hit the recursion limit.)
+
+    Every V vertex's expansion (see expand_neighborhood) is kept in a heap
+    ordered by biclique size, then by the position of its first remaining
+    edge, so the heap top is exactly the biclique the first largest seed in
+    edge order would give, and the covers are the same as before.
+    Expansions are only redone for V vertices whose neighborhood, or whose
+    candidates' neighborhoods, the last removed biclique changed; V vertices
+    with identical neighborhoods share one expansion per round.
     
     Args:
         list_of_edges: List of tuples or lists [(u, v), ...] representing edges
+        stats: optional dict, filled with the number of rounds and of seed
+            expansions done ('expanded') and avoided ('skipped')
+        instrument: optional instrument.Instrument, receives the index and
+            search phases and the same numbers as counters
         
     Returns:
-        List of bicliques, where each biclique is represented as a dict:
-        {'U': set of left vertices, 'V': set of right vertices}
+        List of bicliques, each a Biclique record with frozen vertex sets
+        .U (left vertices) and .V (right vertices)
     """
-    # Convert edges to tuples if they're lists
-    list_of_edges = [tuple(edge) if isinstance(edge, list) else edge for edge in list_of_edges]
-    
-    # Base case: if no edges left, return empty list
-    if not list_of_edges or len(list_of_edges) == 0:
-        return []
-    
-    # Build adjacency information for all vertices
-    u_neighbors = {}  # u_node -> set of v neighbors
-    v_neighbors = {}  # v_node -> set of u neighbors
-    all_u_vertices = set()
-    all_v_vertices = set()
-    
-    for u, v in list_of_edges:
-        if u not in u_neighbors:
-            u_neighbors[u] = set()
-        if v not in v_neighbors:
-            v_neighbors[v] = set()
-        u_neighbors[u].add(v)
-        v_neighbors[v].add(u)
-        all_u_vertices.add(u)
-        all_v_vertices.add(v)
-    
-    # Find the LARGEST maximal biclique by checking all possibilities
-    largest_biclique = None
-    largest_size = 0
-    
-    for u_start, v_start in list_of_edges:
-        # Initialize with one edge
-        U_set = {u_start}
-        V_set = {v_start}
-        
-        # Expand to find a maximal biclique
-        for u in all_u_vertices:
-            if u not in U_set:
-                if V_set.issubset(u_neighbors.get(u, set())):
-                    U_set.add(u)
-        
-        for v in all_v_vertices:
-            if v not in V_set:
-                if U_set.issubset(v_neighbors.get(v, set())):
-                    V_set.add(v)
-        
-        # Refine until the biclique is maximal
-        changed = True
-        while changed:
-            changed = False
-            
-            # Remove any U vertex not connected to all V vertices
-            U_set = {u for u in U_set if V_set.issubset(u_neighbors.get(u, set()))}
-            
-            # Remove any V vertex not connected to all U vertices
-            V_set = {v for v in V_set if U_set.issubset(v_neighbors.get(v, set()))}
-            
-            # Try to add more vertices
-            for u in all_u_vertices:
-                if u not in U_set and V_set.issubset(u_neighbors.get(u, set())):
-                    U_set.add(u)
-                    changed = True
-            
-            for v in all_v_vertices:
-                if v not in V_set and U_set.issubset(v_neighbors.get(v, set())):
-                    V_set.add(v)
-                    changed = True
-        
-        # Check if this is the largest biclique found so far
-        biclique_size = len(U_set) * len(V_set)
-        if biclique_size > largest_size:
-            largest_size = biclique_size
-            largest_biclique = {'U': U_set, 'V': V_set}
-    
-    # If no biclique found, return empty (shouldn't happen with valid edges)
-    if largest_biclique is None:
-        return []
-    
-    # Remove edges covered by this biclique
-    covered_edges = {(u, v) for u in largest_biclique['U'] for v in largest_biclique['V']}
-    remaining_edges = [edge for edge in list_of_edges if edge not in covered_edges]
-    
-    # Recursively find cover for remaining edges
-    rest_of_cover = recursive_search(remaining_edges)
-    
-    # Return this biclique plus the rest
-    return [largest_biclique] + rest_of_cover 
+    instrument = NULL if instrument is None else instrument
+
+    with instrument.phase("index"):
+        # Remaining edges in input order (dict used as an ordered set): edge -> position
+        remaining_edges = {}
+        for edge in list_of_edges:
+            remaining_edges.setdefault(tuple(edge), len(remaining_edges))
+
+        # Adjacency of the remaining edges; V neighborhoods packed as bits over U
+        u_neighbors = {}  # u_node -> set of v neighbors
+        v_masks = {}      # v_node -> int, bit i set if U vertex number i is a neighbor
+        u_index = {}
+        u_bit = []
+        for u, v in remaining_edges:
+            if u not in u_index:
+                u_index[u] = len(u_bit)
+                u_bit.append(u)
+            u_neighbors.setdefault(u, set()).add(v)
+            v_masks[v] = v_masks.get(v, 0) | (1 << u_index[u])
+
+        first_edge = {}   # v_node -> position of its first remaining edge
+        for (u, v), position in remaining_edges.items():
+            first_edge.setdefault(v, position)
+
+    seeds = 0       # every remaining edge is a seed in every round
+    expanded = 0
+    rounds = 0
+    version = {v: 0 for v in v_masks}   # bumped when the heap entries of v go out of date
+    heap = []
+    stale = set(v_masks)
+
+    with instrument.phase("search"):
+        cover = []
+        while remaining_edges:
+            rounds += 1
+            seeds += len(remaining_edges)
+
+            # Re-expand the V vertices touched by the last round (once per distinct neighborhood)
+            by_signature = {}
+            for v in stale:
+                if not v_masks.get(v):
+                    continue
+                signature = v_masks[v]
+                if signature not in by_signature:
+                    by_signature[signature] = expand_neighborhood(v, v_masks, u_neighbors, u_bit)
+                    expanded += 1
+                U_set, V_set = by_signature[signature]
+                heapq.heappush(heap, (-len(U_set) * len(V_set), first_edge[v], v, version[v], U_set, V_set))
+            stale = set()
+
+            # Largest biclique; ties go to the seed that comes first in the edge list
+            while True:
+                _, _, v, v_version, U_set, V_set = heapq.heappop(heap)
+                if v_version == version[v]:
+                    break
+            largest_biclique = Biclique(U_set, V_set)
+            cover.append(largest_biclique)
+
+            # Everything within two steps of the removed edges may expand differently now
+            for u in largest_biclique.U:
+                stale.update(u_neighbors[u])
+
+            # Remove edges covered by this biclique, from the edge list and the adjacency
+            removed_bits = 0
+            for u in largest_biclique.U:
+                removed_bits |= 1 << u_index[u]
+                for v in largest_biclique.V:
+                    del remaining_edges[(u, v)]
+                u_neighbors[u] -= largest_biclique.V
+            for v in largest_biclique.V:
+                v_masks[v] &= ~removed_bits
+                if v_masks[v]:
+                    first_edge[v] = min(remaining_edges[(u, v)] for u in mask_vertices(v_masks[v], u_bit))
+                else:
+                    del v_masks[v]
+            for u in largest_biclique.U:
+                if not u_neighbors[u]:
+                    del u_neighbors[u]
+            for v in stale:
+                version[v] += 1
+
+    counts = {"rounds": rounds, "expanded": expanded, "skipped": seeds - expanded}
+    instrument.add_counts(counts)
+    if stats is not None:
+        stats.update(counts)
+    return cover
 
 
 
@@ -106,18 +154,21 @@ def recursive_search(list_of_edges):
 
 
 if __name__ == "__main__":
-    #import difficult_datasets as dd
-    graph = dd.difficult_graphs["Crown_S11"]
+    # Run from src/: python3 -m custom.JaredAlgorithm
+    import datasets
+    graph = datasets.get("Crown_S11")
     
     # Call recursive_search to find biclique cover
-    biclique_cover = recursive_search(graph)
+    stats = {}
+    biclique_cover = recursive_search(graph, stats)
     
     print(f"Found {len(biclique_cover)} bicliques:")
     for i, biclique in enumerate(biclique_cover, 1):
         print(f"Biclique {i}:")
-        print(f"  U (left):  {sorted(biclique['U'])}")
-        print(f"  V (right): {sorted(biclique['V'])}")
-        print(f"  Edges covered: {len(biclique['U']) * len(biclique['V'])}")
+        print(f"  U (left):  {sorted(biclique.U)}")
+        print(f"  V (right): {sorted(biclique.V)}")
+        print(f"  Edges covered: {biclique.m}")
         print()
     
-    print(f"Total bipartite dimension k = {len(biclique_cover)}")
\ No newline at end of file
+    print(f"Total bipartite dimension k = {len(biclique_cover)}")
+    print(f"Seeds expanded: {stats['expanded']}, skipped: {stats['skipped']} over {stats['rounds']} rounds")
\ No newline at end of file
@@ -1,132 +1,17 @@
 
-from typing import Generator, Optional
-from graph import Graph
-from bipartite import CompleteBipartiteGraph
-import random
-from math import isqrt
-
-
-def approx_biclique_cover(G: Graph, k: Optional[int] = None) -> Generator[CompleteBipartiteGraph, None, None]:
-    
-    def uncovered_neighbors(v):
-        return {w for e in E if (v in e) for w in e.vertices() if (v != w)}
-    
-    k = isqrt(G.m)+1 if (k is None) else k      # number of samples
-    E = set(G.C.keys())                         # uncovered edges
-
-    while len(E) > 0:
-
-        u, v = next(iter(E)).vertices()
-        B = CompleteBipartiteGraph({u}, {v})    # backup biclique in case loop results in empty graph, so algorithm always makes progress
-
-        E_sample = E if (len(E) <= k) else set(random.sample(list(E), k))
-        most_covered_edges = 0                  # most number of uncovered edges covered with a biclique
-
-        for e in E_sample:
-
-            u, v = e.vertices()
-            L = uncovered_neighbors(u)
-            R = uncovered_neighbors(v) - L
-
-            # loop until convergence on biclique
-            while L and R:
-                L_old, R_old = L, R
-                L = set.intersection(*[uncovered_neighbors(v) for v in R])
-                R = set.intersection(*[uncovered_neighbors(v) for v in L]) - L
-                if (L_old == L) and (R_old == R):
-                    break
-
-            b = CompleteBipartiteGraph(L, R)
-            covered_edges = len(E.intersection(set(b.C.keys())))
-            if (covered_edges > most_covered_edges):
-                B = b
-                most_covered_edges = covered_edges
-        
-        E -= set(B.C.keys())        # remove edges that are now covered by B
-
-        yield B
-
-
-def optimized_approx_biclique_cover(G: Graph, k: Optional[int] = None) -> Generator[CompleteBipartiteGraph, None, None]:
-    
-    k = isqrt(G.m)+1 if (k is None) else k                          # number of samples
-    E = set(frozenset(e._vertices) for e in G.C.keys())             # uncovered edges
-    uncovered_neighbors = {v: G.adjacent(v) for v in G.vertices()}
-
-    while len(E) > 0:
+# Tate's custom variant of the sampling heuristic (Part 3). The engine is shared with Part 2 and lives in
+# src/approx_biclique_cover.py; this module only picks its optimized variant, which starts every sampled edge from
+# the larger of its two neighborhoods. Run from src/ as a module: python3 -m custom.approx_biclique_cover
 
-        # backup biclique in case loop results in empty graph, so algorithm always makes progress
-        u, v = next(iter(E))
-        B_edges = {frozenset({u, v})}
-        best_L = {u}
-        best_R = {v}
-
-        E_sample = E if (len(E) <= k) else set(random.sample(tuple(E), k))
-        most_covered_edges = 0                  # most number of uncovered edges covered with a biclique
-
-        for e in E_sample:
-
-            u, v = e
-            L = uncovered_neighbors[u]
-            R = uncovered_neighbors[v] - L
-            if len(L) < len(R):
-                L, R = R, L
-
-            # loop until convergence on biclique
-            while L and R:
-                L_old, R_old = L, R
-                L = set.intersection(*[uncovered_neighbors[v] for v in R])
-                R = set.intersection(*[uncovered_neighbors[v] for v in L]) - L
-                if (L_old == L) and (R_old == R):
-                    break
-
-            b_edges = set(frozenset({u, v}) for u in L for v in R)
-            covered_edges = len(E.intersection(b_edges))
-            if (covered_edges > most_covered_edges):
-                most_covered_edges = covered_edges
-                B_edges = b_edges
-                best_L = L
-                best_R = R
-        
-        E -= B_edges
-        for e in B_edges:
-            u, v = e
-            uncovered_neighbors[u].discard(v)
-            uncovered_neighbors[v].discard(u)
-
-        yield CompleteBipartiteGraph(best_L, best_R)
+from typing import Optional
+from graph import Graph
+from approx_biclique_cover import optimized_approx_biclique_cover, dataset_to_graph_object
 
 
 def approx_biclique_cover_number(G : Graph, k : Optional[int] = None) -> int:
-    # return sum(1 for _ in approx_biclique_cover(G, k))
     return sum(1 for _ in optimized_approx_biclique_cover(G, k))
 
 
-def dataset_to_graph_object(edges_list):
-    """
-    Converts a list of tuples [(u, v), ...] into a Graph object.
-    """
-    G = Graph()
-
-    # 1. Collect all unique vertices first
-    all_vertices = set()
-    for u, v in edges_list:
-        all_vertices.add(u)
-        all_vertices.add(v)
-
-    # 2. Add vertices to Graph
-    # We unpack the set into arguments
-    G.add_vertex(*all_vertices)
-
-    # 3. Add Edges
-    for u, v in edges_list:
-        # Create the specific Edge object required by the class
-        edge_obj = Graph.Edge(u, v)
-        G.add_edge(edge_obj)
-
-    return G
-
-
 if __name__ == "__main__":
     crown_edges = [(0, 3), (0, 4), (1, 3), (1, 5), (2, 4), (2, 5)]
 
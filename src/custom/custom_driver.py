@@ -1,12 +1,11 @@
-import time
+# Run from src/ as a module (python3 -m custom.custom_driver): src/ is then on the import path, so the solver
+# registry, the datasets and the shared Graph / Biclique / verifier modules are the same ones the Part 2 code uses.
 import statistics
 
-import JaredAlgorithm
-import kevin_DP_algo
 from graph import Graph
-from approx_biclique_cover import approx_biclique_cover_number
-
-import test_graphs as dd
+from cover_verifier import verify_cover
+import solvers
+import datasets
 """
 def edges_to_matrix(edges):
     
@@ -50,82 +49,82 @@ def edges_to_graph_obj(edges):
     return G
 
 
-# Wrappers
+# Wrappers (one Instance per call; main() shares one Instance across solvers and repetitions)
 
 def run_kevin(edges):
     """
     Wrapper for Kevin's Custom Dynamic Programming Solver.
+    Returns (k, cover).
     """
-    # Create solver instance
-    solver = kevin_DP_algo.BicliqueCoverSolver(edges)
-    # Run with a high max_k limit (15) so it doesn't error out on Hard graphs (k=9)
-    return solver.solve()
+    result = solvers.solve("kevin_dp", solvers.Instance(edges))
+    return result.k, result.cover
 
 
 def run_tate(edges):
     """
     Wrapper for Tate's Custom Algorithm.
+    Returns (k, cover).
     """
-    # 1. Convert Data to Graph Object
-    G = edges_to_graph_obj(edges)
-    # 2. Run Algorithm
-    return approx_biclique_cover_number(G)
+    result = solvers.solve("tate_optimized", solvers.Instance(edges))
+    return result.k, result.cover
 
 
 def run_jared(edges):
     """
     Wrapper for Jared's Custom Algorithm.
+    Returns (k, cover).
     """
-    return len(JaredAlgorithm.recursive_search(edges))
+    result = solvers.solve("jared_search", solvers.Instance(edges))
+    return result.k, result.cover
 
 
 
 def main():
     # Driver code
-    algorithms = {
-        "Kevin (Custom, DP)": run_kevin,
-        "Tate (Custom)": run_tate,
-        "Jared (Custom)": run_jared
-    }
+    algorithms = ["kevin_dp", "tate_optimized", "jared_search"]
 
     graphs_to_test = {
-        "Easy (Matching 6)": dd.TEST_DATA["Easy_Matching_6"],
-        "Medium (Matching 8)": dd.TEST_DATA["Medium_Matching_8"],
-        "Hard (Matching 10)": dd.TEST_DATA["Hard_Dense_Half_10"]
+        "Easy (Matching 6)": datasets.get("Easy_Matching_6"),
+        "Medium (Matching 8)": datasets.get("Medium_Matching_8"),
+        "Hard (Matching 10)": datasets.get("Hard_Dense_Half_10")
     }
+    # Each graph is converted (Graph object, biclique masks, ...) once, outside the timed runs
+    instances = {graph_name: solvers.Instance(edges, graph_name) for graph_name, edges in graphs_to_test.items()}
 
-    print(f"{'ALGORITHM':<20} | {'DATASET':<20} | {'AVG TIME (s)':<12} | {'RESULT (k)':<10}")
-    print("-" * 75)
+    print(f"{'ALGORITHM':<20} | {'DATASET':<20} | {'AVG TIME (s)':<12} | {'RESULT (k)':<10} | COVER")
+    print("-" * 100)
 
-    for algo_name, algo_func in algorithms.items():
+    for algo_name in algorithms:
+        solver = solvers.SOLVERS[algo_name]
 
-        for graph_name, edges in graphs_to_test.items():
+        for graph_name, instance in instances.items():
 
             run_times = []
             results = []
+            cover = None
 
             # Run 5 times for average
             for i in range(5):
-                t_start = time.perf_counter()
-
                 try:
-                    k = algo_func(edges)
+                    result = solver.solve(instance)
+                    k, cover = result.k, result.cover
+                    run_times.append(result.timings["solve"])
                 except Exception as e:
                     # Catch errors so one crash doesn't stop everything
-                    k = "ERR"
+                    k, cover = "ERR", None
 
-                t_end = time.perf_counter()
-
-                run_times.append(t_end - t_start)
                 results.append(k)
 
-            avg_time = statistics.mean(run_times)
+            avg_time = statistics.mean(run_times) if run_times else float("nan")
 
             final_k = results[-1]
 
-            print(f"{algo_name:<20} | {graph_name:<20} | {avg_time:.6f}s    | k={final_k}")
+            # Check the cover of the last run (if the algorithm reports one)
+            verdict = "n/a" if cover is None else verify_cover(instance.edges, cover)
+
+            print(f"{solver.label:<20} | {graph_name:<20} | {avg_time:.6f}s    | k={final_k:<8} | {verdict}")
 
-        print("-" * 75)
+        print("-" * 100)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,12 @@
 from collections import defaultdict
 from itertools import combinations
 from math import inf
+import hashlib
+import os
+import pickle
+import time
+from bipartite import Biclique
+from instrument import NULL
 
 class BicliqueGenerator:
     """
@@ -60,6 +66,49 @@ class BicliqueGenerator:
 
         return biclique_masks
 
+    def find_automorphism_generators(self):
+        """
+        Finds cheap generators of the graph's automorphism group, given as
+        edge index permutations (lists where perm[idx] is the image of idx).
+        Only swaps of two same-side vertices are tried, either alone (twins)
+        or paired with the swap of the two vertices their neighborhoods
+        differ in. That covers the symmetries of crown, matching and modulo
+        graphs; it is not the full group in general, which is fine because
+        canonicalization only needs the generators to be automorphisms.
+        """
+        generators = []
+        seen = set()
+        sides = ((self.adj_u, self.adj_v, 0), (self.adj_v, self.adj_u, 1))
+
+        for adj, other_adj, side in sides:
+            for a, b in combinations(sorted(adj), 2):
+                diff = adj[a] ^ adj[b]
+                swap_this = {a: b, b: a}
+                swap_other = {}
+                if len(diff) == 2:
+                    c, d = diff
+                    swap_other = {c: d, d: c}
+                elif diff:
+                    continue
+
+                perm = []
+                for edge in self.edges:
+                    this_node, other_node = edge[side], edge[1 - side]
+                    image = [0, 0]
+                    image[side] = swap_this.get(this_node, this_node)
+                    image[1 - side] = swap_other.get(other_node, other_node)
+                    idx = self.edge_index.get(tuple(image))
+                    if idx is None:
+                        break
+                    perm.append(idx)
+                else:
+                    perm = tuple(perm)
+                    if perm not in seen:
+                        seen.add(perm)
+                        generators.append(list(perm))
+
+        return generators
+
     def find_intersection(self, edge_set, trip_num: int):
         sets_to_intersect = []
         if trip_num == 1:
@@ -86,16 +135,172 @@ class BicliqueCoverSolver:
     Uses bitmasking and bitwise operations to find where a biclique is needed for covering
     Returns the exact Bipartite dimension.
     """
-    def __init__(self, edges):
+    def __init__(self, edges, branching="min_candidates", symmetry=False, generators=None,
+                 checkpoint_path=None, checkpoint_interval=60.0, biclique_masks=None, instrument=None):
         # Instantiates helper class to get the bitmasks
+        # (biclique_masks can be passed in if they were already enumerated for these edges)
+        # instrument (see instrument.py) receives the enumerate / search / cover phases and the
+        # bicliques enumerated, nodes expanded and memo hits
+        self.instrument = NULL if instrument is None else instrument
         generator = BicliqueGenerator(edges)
-        self.biclique_masks = generator.find_maximal_bicliques()
+        if biclique_masks is None:
+            with self.instrument.phase("enumerate"):
+                biclique_masks = generator.find_maximal_bicliques()
+        self.biclique_masks = biclique_masks
+        self.instrument.count("bicliques_enumerated", len(biclique_masks))
 
+        self.edges = [tuple(edge) for edge in edges]
         self.num_edges = len(edges)
         self.full_mask = (1 << self.num_edges) - 1  # The target
         self.memo = {}
+        self.nodes_expanded = 0
+        self.memo_hits = 0
+
+        # Checkpointing: the memo table is written to checkpoint_path at most
+        # every checkpoint_interval s (and whenever a top-level solve finishes).
+        # Memo entries are exact costs that never change once stored, so the
+        # file is an append-only log: a header with the input's signature,
+        # then one pickled dict per save holding only the entries added since
+        # the previous save. Memo keys are edge-index masks, so the signature
+        # covers edge order.
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.last_checkpoint = time.perf_counter()
+        self.depth = 0              # recursion depth of _search
+        self.unsaved = []           # memo keys not written to the checkpoint yet
+        self.checkpoint_started = False     # header written (or a matching file loaded)
+        self.signature = hashlib.sha1(repr((
+            [tuple(edge) for edge in edges], branching, symmetry or (generators is not None)
+        )).encode()).hexdigest()
+
+        # Candidate bicliques for every edge index, in enumeration order
+        self.edge_candidates = [[] for _ in range(self.num_edges)]
+        for candidate in self.biclique_masks:
+            remaining = candidate
+            while remaining:
+                low_bit = remaining & -remaining
+                self.edge_candidates[low_bit.bit_length() - 1].append(candidate)
+                remaining ^= low_bit
+
+        # Order in which uncovered edges are considered for branching
+        # "first" = lowest-indexed uncovered edge (original rule)
+        # "min_candidates" = uncovered edge contained in the fewest bicliques
+        if branching == "first":
+            self.branch_order = list(range(self.num_edges))
+        elif branching == "min_candidates":
+            self.branch_order = sorted(range(self.num_edges), key=lambda idx: len(self.edge_candidates[idx]))
+        else:
+            raise ValueError("branching must be 'first' or 'min_candidates'")
+        self.branching = branching
+
+        # Symmetry mode: covering states that are images of each other under
+        # a graph automorphism share one memo entry (see canonical_mask)
+        self.symmetry = symmetry or (generators is not None)
+        self.symmetry_moves = []
+        if self.symmetry:
+            if generators is None:
+                generators = generator.find_automorphism_generators()
+            for perm in generators:
+                # Group moved bits by shift distance so a generator is applied
+                # with a few big-int shifts instead of one step per edge
+                shifts = defaultdict(int)
+                fixed = self.full_mask
+                for idx, image in enumerate(perm):
+                    if idx != image:
+                        shifts[image - idx] |= 1 << idx
+                        fixed &= ~(1 << idx)
+                if shifts:
+                    self.symmetry_moves.append((fixed, list(shifts.items())))
+
+        # Resume from an earlier (interrupted) run on the same input
+        self.load_checkpoint()
 
-    def solve(self, mask=0):
+    def load_checkpoint(self):
+        """
+        Restores the memo table from checkpoint_path. Solved subproblems
+        come back as memo hits, so calling solve() afterwards only expands
+        the states that were not finished before the interruption.
+        A chunk cut short by a crash mid-write is dropped from the file.
+        Returns True if a checkpoint for this exact input was loaded.
+        """
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return False
+        with open(self.checkpoint_path, "rb") as f:
+            try:
+                header = pickle.load(f)
+            except (EOFError, pickle.UnpicklingError):
+                return False
+            if not isinstance(header, dict) or header.get("signature") != self.signature:
+                return False
+            end = f.tell()
+            while True:
+                try:
+                    self.memo.update(pickle.load(f))
+                except (EOFError, pickle.UnpicklingError):
+                    break
+                end = f.tell()
+            broken_tail = f.seek(0, os.SEEK_END) > end
+        if broken_tail:
+            # later saves append after the last complete chunk
+            with open(self.checkpoint_path, "r+b") as f:
+                f.truncate(end)
+        self.checkpoint_started = True
+        return True
+
+    def save_checkpoint(self, force=False):
+        """Appends the memo entries added since the last save to checkpoint_path."""
+        if self.checkpoint_path is None:
+            return
+        now = time.perf_counter()
+        if not force and (now - self.last_checkpoint) < self.checkpoint_interval:
+            return
+        if not self.checkpoint_started:
+            # new file (or one for another input): header, then everything known so far
+            with open(self.checkpoint_path, "wb") as f:
+                pickle.dump({"signature": self.signature}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(self.memo, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.checkpoint_started = True
+        elif self.unsaved:
+            with open(self.checkpoint_path, "ab") as f:
+                pickle.dump({key: self.memo[key] for key in self.unsaved}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.unsaved = []
+        self.last_checkpoint = time.perf_counter()
+
+    def canonical_mask(self, mask):
+        """
+        Maps a covering state to a representative of its symmetry orbit by
+        repeatedly applying any generator that makes the mask smaller.
+        The result is always in the same orbit, so it is a safe memo key;
+        symmetric states usually (not always) land on the same one.
+        """
+        improved = True
+        while improved:
+            improved = False
+            for fixed, shifts in self.symmetry_moves:
+                image = mask & fixed
+                for delta, moved in shifts:
+                    if delta > 0:
+                        image |= (mask & moved) << delta
+                    else:
+                        image |= (mask & moved) >> -delta
+                if image < mask:
+                    mask = image
+                    improved = True
+        return mask
+
+    def solve(self, mask=0, start=0):
+        """
+        Returns the minimum number of bicliques that cover the edges not yet
+        covered in mask (by default: the bipartite dimension of the graph).
+        """
+        expanded, hits = self.nodes_expanded, self.memo_hits
+        with self.instrument.phase("search"):
+            cost = self._search(mask, start)
+        self.instrument.add_counts({"nodes_expanded": self.nodes_expanded - expanded,
+                                    "memo_hits": self.memo_hits - hits})
+        return cost
+
+    def _search(self, mask, start):
         """
         This is where the Dynamic Programming happens.
         Takes in a mask which is whatever the current state of edge covering is.
@@ -103,35 +308,121 @@ class BicliqueCoverSolver:
         1 = covered at that index
         0 = uncovered at that index
         The algorithm runs until all bits are 1 (covered, base case)
+        start is the position in branch_order before which every edge is
+        already covered; masks only grow along a branch, so it is passed down
+        instead of rescanning the order from the beginning.
         Returns the minimum biclique cover number for the graph of edges.
         """
         # Check Memo
-        if mask in self.memo:
-            return self.memo[mask]
+        key = self.canonical_mask(mask) if self.symmetry else mask
+        if key in self.memo:
+            self.memo_hits += 1
+            return self.memo[key]
 
         # Base Case (Done?)
         if mask == self.full_mask:
             return 0
 
-        target_edge = -1
-        for idx in range(0, self.num_edges):
-            if (mask & (1 << idx)) == 0:
-                target_edge = idx
-                break
+        self.nodes_expanded += 1
+
+        # Most constrained uncovered edge (or lowest index, see branch_order)
+        pos = start
+        while (mask >> self.branch_order[pos]) & 1:
+            pos += 1
+        target_edge = self.branch_order[pos]
 
         best_cost = inf
-        for candidate in self.biclique_masks:
-            if (candidate >> target_edge) & 1:
-                new_mask = mask | candidate
-                cost = 1 + self.solve(new_mask)
-                best_cost = min(best_cost, cost)
-            else:
+        tried = set()
+        self.depth += 1
+        for candidate in self.edge_candidates[target_edge]:
+            new_mask = mask | candidate
+            # Different bicliques can leave the same covering state behind
+            if new_mask in tried:
                 continue
+            tried.add(new_mask)
+            cost = 1 + self._search(new_mask, pos + 1)
+            best_cost = min(best_cost, cost)
+        self.depth -= 1
 
-        self.memo[mask] = best_cost
+        self.memo[key] = best_cost
+        if self.checkpoint_path is not None:
+            self.unsaved.append(key)
+            self.save_checkpoint(force=(self.depth == 0))
         return best_cost
 
+    def mask_to_biclique(self, mask):
+        """Turns an edge bitmask back into a Biclique record of its endpoints."""
+        U, V = set(), set()
+        while mask:
+            low_bit = mask & -mask
+            u_node, v_node = self.edges[low_bit.bit_length() - 1]
+            U.add(u_node)
+            V.add(v_node)
+            mask ^= low_bit
+        return Biclique(U, V)
+
+    def stored_cost(self, mask, start):
+        """
+        The cost of a covering state, read from the memo when a search
+        already stored it (without counting a memo hit), searched otherwise.
+        """
+        if mask == self.full_mask:
+            return 0
+        key = self.canonical_mask(mask) if self.symmetry else mask
+        if key in self.memo:
+            return self.memo[key]
+        return self._search(mask, start)
+
+    def find_cover(self):
+        """
+        Returns a minimum cover as a list of Biclique records.
+        Walks down from the empty mask, at every state taking a candidate
+        whose subproblem cost is exactly one less. After solve() every state
+        on the way is in the memo (symmetric states share a cost, so
+        canonical keys are fine too), so the walk does not search again;
+        without a previous solve() it runs one first.
+        """
+        cover = []
+        mask, pos = 0, 0
+        root = self.canonical_mask(0) if self.symmetry else 0
+        remaining = self.memo[root] if root in self.memo else self.solve()
+        with self.instrument.phase("cover"):
+            while mask != self.full_mask:
+                while (mask >> self.branch_order[pos]) & 1:
+                    pos += 1
+                for candidate in self.edge_candidates[self.branch_order[pos]]:
+                    new_mask = mask | candidate
+                    if new_mask == mask:
+                        continue
+                    cost = self.stored_cost(new_mask, pos + 1)
+                    if cost == remaining - 1:
+                        cover.append(self.mask_to_biclique(candidate))
+                        mask, remaining = new_mask, cost
+                        break
+        return cover
+
 if __name__ == "__main__":
+    # Run from src/: python3 -m custom.kevin_DP_algo [dataset names, e.g. Crown_S8 Crown_S9]
+    import sys
+    import datasets
+
     test_edges = [(0, 10), (0, 11), (1, 10), (1, 11), (2, 12)]
     solver = BicliqueCoverSolver(test_edges)
-    print(solver.solve())
\ No newline at end of file
+    print(solver.solve())
+
+    # Compare the branching rules on the denser test graphs
+    for name in ("Hard_Dense_Half_10",):
+        for branching in ("first", "min_candidates"):
+            solver = BicliqueCoverSolver(datasets.get(name), branching=branching)
+            k = solver.solve()
+            print(f"{name} ({branching}): k={k}, nodes expanded={solver.nodes_expanded}, memo size={len(solver.memo)}")
+
+    # Memo size and runtime with/without symmetry canonicalization, for the
+    # datasets named on the command line
+    for name in sys.argv[1:]:
+        for symmetry in (False, True):
+            start = time.perf_counter()
+            solver = BicliqueCoverSolver(datasets.get(name), symmetry=symmetry)
+            k = solver.solve()
+            elapsed = time.perf_counter() - start
+            print(f"{name} (symmetry={symmetry}): k={k}, memo size={len(solver.memo)}, time={elapsed:.3f}s")
@@ -0,0 +1,238 @@
+"""Lazy registry of the named datasets.
+
+Every dataset is a named factory that is only called the first time the
+dataset is asked for; importing this module (or any solver) builds no
+graph at all. Entries know their group and, where the construction gives
+them, the bounds on k (see graph_generators), so results can be checked:
+
+    import datasets
+    edges = datasets.get("Crown_S11")          # generated now, kept in memory
+    datasets.dataset("Crown_S11").upper        # 6
+    datasets.names("difficult")                # names in one group
+
+Entries registered with cache=True are also written to CACHE_DIR the first
+time they are generated, and read back from there afterwards, in a small
+binary graph format (little-endian):
+
+    b"BGRF"                  magic
+    uint32  version          (1)
+    uint64  m                number of edges
+    int64 * 2m               u0, v0, u1, v1, ...
+
+Cache file names include a hash of the entry's parameters, so changing a
+factory's parameters never reads a stale file.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+
+import graph_generators as gen
+
+CACHE_DIR = os.environ.get("BICLIQUE_DATASET_CACHE",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset_cache"))
+
+_MAGIC = b"BGRF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQ")
+
+
+def write_edges(path, edges):
+    """Writes (u, v) edges in the binary graph format (atomically, via a temp file)."""
+    flat = array("q")
+    for u, v in edges:
+        flat.append(u)
+        flat.append(v)
+    if sys.byteorder != "little":
+        flat.byteswap()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(flat) // 2))
+        flat.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def read_edges(path):
+    """Reads a file in the binary graph format back into a list of (u, v) tuples."""
+    with open(path, "rb") as f:
+        magic, version, m = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a version {_VERSION} binary graph file")
+        flat = array("q")
+        flat.fromfile(f, 2 * m)
+    if sys.byteorder != "little":
+        flat.byteswap()
+    return list(zip(flat[0::2], flat[1::2]))
+
+
+class Dataset:
+
+    def __init__(self, name, group, factory=None, lower=None, upper=None, params=None, cache=False, make=None):
+        # either factory() returns an iterable of (u, v) edges, or make() returns a GeneratedGraph
+        self.name = name
+        self.group = group
+        self.cache = cache          # also keep the edges in CACHE_DIR
+        self._factory = factory
+        self._make = make
+        self._generated = None
+        self._lower = lower         # known bounds on k (None if unknown)
+        self._upper = upper
+        self._params = {} if params is None else params
+        self._edges = None
+
+    def generated(self):
+        """The GeneratedGraph of a generator entry (built on first use), None for other entries."""
+        if self._make is not None and self._generated is None:
+            self._generated = self._make()
+        return self._generated
+
+    @property
+    def lower(self):
+        G = self.generated()
+        return self._lower if G is None else G.lower
+
+    @property
+    def upper(self):
+        G = self.generated()
+        return self._upper if G is None else G.upper
+
+    @property
+    def params(self):
+        G = self.generated()
+        return self._params if G is None else G.describe()
+
+    @property
+    def exact_k(self):
+        """k if it is known exactly, otherwise None."""
+        return self.lower if (self.lower is not None and self.lower == self.upper) else None
+
+    @property
+    def cache_path(self):
+        key = hashlib.sha1(json.dumps(self.params, sort_keys=True).encode()).hexdigest()[:12]
+        return os.path.join(CACHE_DIR, f"{self.name}-{key}.bgr")
+
+    @property
+    def loaded(self):
+        return self._edges is not None
+
+    @property
+    def edges(self):
+        """The edge list, generated (or read from the disk cache) on first access."""
+        if self._edges is None:
+            if self.cache and os.path.exists(self.cache_path):
+                self._edges = read_edges(self.cache_path)
+            else:
+                source = self._factory() if self._make is None else self.generated().edges()
+                self._edges = [tuple(edge) for edge in source]
+                if self.cache:
+                    write_edges(self.cache_path, self._edges)
+        return self._edges
+
+    def unload(self):
+        """Drops the in-memory edges (the disk cache is kept)."""
+        self._edges = None
+
+    def __repr__(self):
+        bounds = "" if self.lower is None else (f", k={self.lower}" if self.exact_k is not None
+                                                else f", k in [{self.lower}, {self.upper}]")
+        return f"Dataset({self.name}, group={self.group}{bounds})"
+
+
+REGISTRY = {}
+
+
+def register(name, factory, group, lower=None, upper=None, params=None, cache=False):
+    """Adds a dataset; factory() is only called when the edges are first needed."""
+    if name in REGISTRY:
+        raise ValueError(f"dataset '{name}' is already registered")
+    REGISTRY[name] = Dataset(name, group, factory, lower, upper, params, cache)
+    return REGISTRY[name]
+
+
+def register_generated(name, make, group, cache=False):
+    """
+    Adds a graph_generators family. make() returns its GeneratedGraph; it
+    is called the first time the entry's edges, bounds or parameters are
+    needed, and the edges are streamed from it.
+    """
+    if name in REGISTRY:
+        raise ValueError(f"dataset '{name}' is already registered")
+    REGISTRY[name] = Dataset(name, group, cache=cache, make=make)
+    return REGISTRY[name]
+
+
+def dataset(name):
+    if name not in REGISTRY:
+        raise KeyError(f"unknown dataset '{name}', available: {', '.join(REGISTRY)}")
+    return REGISTRY[name]
+
+
+def get(name):
+    """The edge list of a dataset."""
+    return dataset(name).edges
+
+
+def names(*groups):
+    """Dataset names in registration order, only from the given groups if any."""
+    return [name for name, entry in REGISTRY.items() if not groups or entry.group in groups]
+
+
+def groups():
+    return list(dict.fromkeys(entry.group for entry in REGISTRY.values()))
+
+
+def expected_k(name):
+    """Known k of a dataset, or '?' (for printing)."""
+    k = dataset(name).exact_k
+    return "?" if k is None else k
+
+
+# --- toy_datasets.py (hand-written, small) ---
+
+def _toy(name):
+    def factory():
+        from toy_datasets import graphs
+        return graphs[name]
+    return factory
+
+
+for _name, _k in (("star_graph", 1), ("matching_graph", 2), ("crown_graph", 3), ("k44", 1), ("k_6", 6)):
+    register(_name, _toy(_name), "toy", _k, _k)
+
+# --- test_graphs.py ---
+
+register_generated("Easy_Matching_6", lambda: gen.matching(6), "test")
+register_generated("Medium_Matching_8", lambda: gen.matching(8), "test")
+register_generated("Hard_Dense_Half_9", lambda: gen.half_graph(9), "test")       # run_this.py; seconds for kevin_sat
+register_generated("Hard_Dense_Half_10", lambda: gen.half_graph(10), "test")     # minutes for kevin_sat
+
+# --- difficult_datasets.py ---
+
+register_generated("Crown_S8", lambda: gen.crown(8), "difficult")
+register_generated("Crown_S9", lambda: gen.crown(9), "difficult")
+register_generated("Union_S5_S5", lambda: gen.crown_union(5, 5), "difficult")
+register_generated("Modulo_Dense_10", lambda: gen.modulo(10, mod_val=3), "difficult")
+register_generated("Crown_S10", lambda: gen.crown(10), "difficult")
+register_generated("Crown_S11", lambda: gen.crown(11), "difficult")
+
+# --- Larger generated graphs (cached on disk) ---
+
+register_generated("Crown_Union_8_9_M20", lambda: gen.crown_union(8, 9, matchings=(20,)), "scale")
+register_generated("Random_300x300_p05", lambda: gen.random_bipartite(300, 300, 0.05, seed=1), "scale", cache=True)
+register_generated("Planted_2000_k40", lambda: gen.planted_cover(2000, 2000, k=40, side=(5, 40), noise=200, seed=1),
+                   "scale", cache=True)
+register_generated("PowerLaw_5000_m50000", lambda: gen.power_law_bipartite(5000, 5000, 50000, seed=1), "scale",
+                   cache=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    for name in names():
+        start = time.perf_counter()
+        edges = get(name)
+        print(f"{dataset(name)}: {len(edges)} edges in {time.perf_counter() - start:.4f}s")
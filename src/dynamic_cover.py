@@ -0,0 +1,197 @@
+
+from typing import Dict, Iterable, List, Optional, Set
+from graph import Graph
+from bipartite import BipartiteGraph, Biclique
+from approx_biclique_cover import optimized_approx_biclique_cover, edge_key
+from collections import defaultdict
+from itertools import count
+import random
+
+
+class DynamicBicliqueCover:
+    # A biclique cover of G that is repaired locally as edges are inserted and deleted:
+    #   deletion:   every biclique containing the edge drops u or v if the edges it then loses are covered elsewhere
+    #               (shrink), otherwise it is split into (L - {u}) x R and {u} x (R - {v})
+    #   insertion:  an existing biclique of u or v is extended by the other endpoint if it stays complete,
+    #               otherwise the larger of the two stars N(u) x N(N(u)) / N(v) x N(N(v)) closed around the edge is added
+    # Every reoptimize_every updates (or on reoptimize()) the bicliques touching the updated vertices are dropped and the
+    # edges only they covered are re-covered with the sampling heuristic; the new bicliques are kept if there are fewer.
+    # All of this only looks at the neighborhoods of the updated vertices and the bicliques through them, not at all of E.
+
+    def __init__(self, G: Graph, cover: Optional[Iterable[Biclique]] = None, reoptimize_every: int = 32,
+                 rng: Optional[random.Random] = None) -> None:
+        self._G = G
+        self._rng = random.Random() if (rng is None) else rng
+        self._reoptimize_every = reoptimize_every
+        self._N : Dict[int, Set[int]] = defaultdict(set)              # neighbors of every vertex
+        for e in G.C.keys():
+            u, v = e.vertices()
+            if u != v:
+                self._N[u].add(v)
+                self._N[v].add(u)
+
+        self._bicliques : Dict[int, Biclique] = {}
+        self._member_of : Dict[int, Set[int]] = defaultdict(set)      # vertex -> ids of the bicliques it is in
+        self._ids = count()
+        for B in (optimized_approx_biclique_cover(G, rng=self._rng) if (cover is None) else cover):
+            self._add(B)
+
+        self._touched : Set[int] = set()
+        self.updates = 0
+        self.reoptimizations = 0
+
+    @property
+    def G(self) -> Graph:
+        return self._G
+
+    @property
+    def k(self) -> int:
+        return len(self._bicliques)
+
+    @property
+    def cover(self) -> List[Biclique]:
+        return list(self._bicliques.values())
+
+    def _add(self, B: Biclique) -> None:
+        if (len(B.U) == 0) or (len(B.V) == 0):
+            return
+        b = next(self._ids)
+        self._bicliques[b] = B
+        for w in (*B.U, *B.V):
+            self._member_of[w].add(b)
+
+    def _remove(self, b: int) -> Biclique:
+        B = self._bicliques.pop(b)
+        for w in (*B.U, *B.V):
+            self._member_of[w].discard(b)
+        return B
+
+    def _containing(self, u: int, v: int) -> List[int]:
+        # ids of the bicliques that cover the edge (u, v)
+        return [b for b in self._member_of[u] & self._member_of[v] if self._bicliques[b].covers(u, v)]
+
+    def is_covered(self, u: int, v: int, exclude: Optional[int] = None) -> bool:
+        return any(b != exclude for b in self._containing(u, v))
+
+    def insert_edge(self, u: int, v: int) -> None:
+        if (u == v) or (v in self._N[u]):
+            return
+        self._insert_into_graph(u, v)
+        self._N[u].add(v)
+        self._N[v].add(u)
+
+        # extend a biclique of u by v (v must see the whole side of u), or the other way round;
+        # among the candidates take the one that covers the most edges afterwards
+        best, best_B = None, None
+        for x, y in ((u, v), (v, u)):
+            for b in self._member_of[x]:
+                B = self._bicliques[b]
+                side, other = (B.U, B.V) if (x in B.U) else (B.V, B.U)
+                if (y not in other) and side <= self._N[y]:
+                    extended = Biclique(side, other | {y}) if (side is B.U) else Biclique(other | {y}, side)
+                    if (best_B is None) or (extended.m > best_B.m):
+                        best, best_B = b, extended
+        if best is not None:
+            self._remove(best)
+            self._add(best_B)
+        else:
+            self._add(max(self._star(u, v), self._star(v, u), key=lambda B: B.m))
+        self._updated(u, v)
+
+    def _star(self, u: int, v: int) -> Biclique:
+        # N(v) x (common neighbors of N(v)): complete, contains (u, v), and maximal on the side of v
+        L = self._N[v]
+        R = set.intersection(*[self._N[w] for w in L])
+        return Biclique(L, R)
+
+    def delete_edge(self, u: int, v: int) -> None:
+        if v not in self._N[u]:
+            return
+        self._remove_from_graph(u, v)
+        self._N[u].discard(v)
+        self._N[v].discard(u)
+
+        for b in self._containing(u, v):
+            B = self._remove(b)
+            L, R = (B.U, B.V) if (u in B.U) else (B.V, B.U)          # u in L, v in R
+            drop_u = Biclique(L - {u}, R)                           # loses {u} x (R - {v})
+            drop_v = Biclique(L, R - {v})                           # loses (L - {u}) x {v}
+            if all(self.is_covered(u, w) for w in R if w != v):
+                self._add(drop_u)
+            elif all(self.is_covered(w, v) for w in L if w != u):
+                self._add(drop_v)
+            else:
+                self._add(drop_u)
+                self._add(Biclique({u}, R - {v}))
+        self._updated(u, v)
+
+    def _updated(self, u: int, v: int) -> None:
+        self._touched.update((u, v))
+        self.updates += 1
+        if (self._reoptimize_every > 0) and (self.updates % self._reoptimize_every == 0):
+            self.reoptimize()
+
+    def reoptimize(self) -> bool:
+        # re-covers the region around the vertices updated since the last call; returns True if the cover shrank
+        touched, self._touched = self._touched, set()
+        region = {b for w in touched for b in self._member_of[w]}
+        if len(region) < 2:
+            return False
+
+        removed = {b: self._remove(b) for b in region}
+        freed = {edge_key(u, v) for B in removed.values() for u, v in B.edges() if not self.is_covered(u, v)}
+        H = Graph({w for e in freed for w in e}, *[Graph.Edge(u, v) for u, v in freed])
+        replacement = list(optimized_approx_biclique_cover(H, rng=self._rng))
+
+        self.reoptimizations += 1
+        if len(replacement) < len(removed):
+            for B in replacement:
+                self._add(B)
+            return True
+        for B in removed.values():
+            self._add(B)
+        return False
+
+    def _insert_into_graph(self, u: int, v: int) -> None:
+        if isinstance(self._G, BipartiteGraph):
+            if (u in self._G.V) or (v in self._G.U):
+                u, v = v, u
+            if u not in self._G.U:
+                self._G.add_vertex(u, subset="U")
+            if v not in self._G.V:
+                self._G.add_vertex(v, subset="V")
+        else:
+            self._G.add_vertex(u, v)
+        self._G.add_edge(Graph.Edge(u, v))
+
+    def _remove_from_graph(self, u: int, v: int) -> None:
+        self._G.remove_edge(Graph.Edge(u, v))
+
+    def __repr__(self) -> str:
+        return f"DynamicBicliqueCover(k={self.k}, updates={self.updates}, reoptimizations={self.reoptimizations})"
+
+
+if __name__ == "__main__":
+    import time
+    from cover_verifier import verify_cover
+
+    rng = random.Random(0)
+    G = Graph.from_file("../test/test_data/test4", Graph.Edge)
+    dynamic = DynamicBicliqueCover(G, rng=rng)
+    print(f"initial: {dynamic}")
+
+    # random edge churn between existing vertices
+    vertices = sorted(G.vertices())
+    start = time.perf_counter()
+    for _ in range(500):
+        u, v = rng.sample(vertices, 2)
+        if v in G.adjacent(u):
+            dynamic.delete_edge(u, v)
+        else:
+            dynamic.insert_edge(u, v)
+    elapsed = time.perf_counter() - start
+    print(f"after 500 updates: {dynamic} in {elapsed:.3f}s, cover valid: {verify_cover(G, dynamic.cover)}")
+
+    start = time.perf_counter()
+    k = sum(1 for _ in optimized_approx_biclique_cover(G, rng=rng))
+    print(f"full rerun: k={k} in {time.perf_counter() - start:.3f}s")
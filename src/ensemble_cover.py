@@ -0,0 +1,179 @@
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from graph import Graph
+from bipartite import Biclique
+from approx_biclique_cover import approx_biclique_cover, optimized_approx_biclique_cover, lazy_approx_biclique_cover
+from multiprocessing.connection import wait
+from collections import Counter
+from math import isqrt
+import multiprocessing
+import os
+import random
+import time
+
+
+VARIANTS = {
+    "approx": approx_biclique_cover,
+    "optimized": optimized_approx_biclique_cover,
+    "lazy": lazy_approx_biclique_cover,
+}
+
+Cover = List[Biclique]
+
+
+class EnsembleResult:
+
+    def __init__(self, cover : Cover, k_values : List[Optional[int]], stopped_early : bool) -> None:
+        self._cover = cover
+        self._k_values = k_values
+        self._stopped_early = stopped_early
+
+    @property
+    def k(self) -> int:
+        return len(self._cover)
+
+    @property
+    def cover(self) -> Cover:
+        return list(self._cover)
+
+    @property
+    def k_values(self) -> List[Optional[int]]:
+        # k of every restart in restart order, None for restarts that were cancelled
+        return self._k_values
+
+    @property
+    def k_distribution(self) -> Dict[int, int]:
+        return dict(sorted(Counter(k for k in self._k_values if k is not None).items()))
+
+    @property
+    def stopped_early(self) -> bool:
+        # True if a restart matched the lower bound or the time budget ran out
+        return self._stopped_early
+
+    def __repr__(self) -> str:
+        return f"EnsembleResult(k={self.k}, k_distribution={self.k_distribution}, stopped_early={self.stopped_early})"
+
+
+def _run_restart(variant : str, k : int, seed : int, G : Graph) -> Cover:
+    return list(VARIANTS[variant](G, k, rng=random.Random(seed)))
+
+
+def _restart_worker(conn, G : Graph, variant : str) -> None:
+    # worker process holding its own copy of the graph (sent once): each message is one restart's
+    # (sample size, seed), answered with (cover, None), or (None, exception) if the restart raised
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        k, seed = message
+        try:
+            conn.send((_run_restart(variant, k, seed, G), None))
+        except Exception as e:
+            conn.send((None, e))
+    conn.close()
+
+
+def restart_plan(G : Graph, restarts : int, seed : int, sample_sizes : Optional[Sequence[int]] = None) -> List[Tuple[int, int]]:
+    # (sample size, seed) for every restart; by default sample sizes cycle around the sqrt(m) used by a single run
+    base = isqrt(G.m)+1
+    sizes = [base, 2*base, max(1, base//2)] if (sample_sizes is None) else list(sample_sizes)
+    seeds = random.Random(seed)
+    return [(sizes[i % len(sizes)], seeds.getrandbits(32)) for i in range(restarts)]
+
+
+def ensemble_biclique_cover(G : Graph, restarts : int = 8, workers : Optional[int] = None, lower_bound : Optional[int] = None,
+                            sample_sizes : Optional[Sequence[int]] = None, seed : int = 0, variant : str = "optimized",
+                            time_budget : Optional[float] = None) -> EnsembleResult:
+    # Runs `restarts` seeded restarts of the sampling heuristic and keeps the smallest cover.
+    #   workers:      number of worker processes (None = one per core, 1 = serial in this process)
+    #   lower_bound:  stop as soon as a restart reaches it (e.g. a known bipartite dimension)
+    #   time_budget:  seconds after which unfinished restarts are abandoned and the best cover so far is returned;
+    #                 with worker processes, restarts still running then are killed, so no CPU is used after the
+    #                 return; serially the budget is only checked between restarts, so a single long restart can
+    #                 overrun it (by at most one restart)
+
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown heuristic variant '{variant}'")
+    plan = restart_plan(G, restarts, seed, sample_sizes)
+    k_values : List[Optional[int]] = [None] * len(plan)
+    best : Optional[Cover] = None
+    stopped_early = False
+    deadline = None if (time_budget is None) else time.perf_counter() + time_budget
+
+    def record(i : int, cover : Cover) -> bool:
+        # returns True once the lower bound is reached
+        nonlocal best
+        k_values[i] = len(cover)
+        if (best is None) or (len(cover) < len(best)):
+            best = cover
+        return (lower_bound is not None) and (len(best) <= lower_bound)
+
+    if workers == 1:
+        for i, (k, restart_seed) in enumerate(plan):
+            if (deadline is not None) and (time.perf_counter() >= deadline) and (best is not None):
+                stopped_early = True
+                break
+            if record(i, _run_restart(variant, k, restart_seed, G)):
+                stopped_early = i < len(plan)-1
+                break
+    else:
+        workers = min((os.cpu_count() or 1) if (workers is None) else workers, len(plan))
+        connections, processes = [], []
+        for _ in range(workers):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_restart_worker, args=(child_conn, G, variant), daemon=True)
+            process.start()
+            child_conn.close()
+            connections.append(parent_conn)
+            processes.append(process)
+        queue = list(enumerate(plan))
+        queue.reverse()
+        busy : Dict[object, int] = {}      # connection -> index of the restart its worker is running
+
+        def submit(conn) -> None:
+            i, (k, restart_seed) = queue.pop()
+            conn.send((k, restart_seed))
+            busy[conn] = i
+
+        try:
+            for conn in connections:
+                if queue:
+                    submit(conn)
+            over_budget = False
+            while busy:
+                timeout = None if (deadline is None) else max(0.0, deadline - time.perf_counter())
+                ready = sorted(wait(list(busy), timeout=timeout), key=busy.get)
+                reached_bound = False
+                for conn in ready:
+                    i = busy.pop(conn)
+                    cover, error = conn.recv()
+                    if error is not None:
+                        raise error
+                    reached_bound = record(i, cover) or reached_bound
+                if (deadline is not None) and (time.perf_counter() >= deadline):
+                    over_budget, deadline = True, None      # if nothing has finished yet, the first result to do so is taken
+                if (busy or queue) and (reached_bound or (over_budget and (best is not None))):
+                    stopped_early = True
+                    break
+                for conn in ready:
+                    if queue:
+                        submit(conn)
+        finally:
+            # idle workers are told to exit, workers still running a restart are killed
+            for conn, process in zip(connections, processes):
+                if conn in busy:
+                    process.kill()
+                else:
+                    conn.send(None)
+                conn.close()
+            for process in processes:
+                process.join()
+
+    return EnsembleResult(best if (best is not None) else [], k_values, stopped_early)
+
+
+if __name__ == "__main__":
+    G = Graph.from_file("../test/test_data/test4", Graph.Edge)
+    start = time.perf_counter()
+    result = ensemble_biclique_cover(G, restarts=16)
+    print(f"{result} in {time.perf_counter() - start:.3f}s")
@@ -2,12 +2,14 @@
 Exact algorithm for the Bipartite Dimension problem."""
 
 import sys
+import os
+import pickle
+import hashlib
 import itertools
 from collections import defaultdict
 import time
-from toy_datasets import graphs, expected_k
-from difficult_datasets import difficult_graphs
-from test_graphs import TEST_DATA
+from bipartite import Biclique
+from instrument import NULL, Instrument
 
 try:
     from pysat.solvers import Minisat22
@@ -16,28 +18,86 @@ except ImportError:
     print("Please install it running: pip install python-sat")
     sys.exit(1)
 
-print_all = False
-
 class BicliqueCoverSolver:
 
-    def __init__(self, edges: list[tuple[int, int]]):
+    def __init__(self, edges: list[tuple[int, int]], checkpoint_path=None, checkpoint_interval=60.0, adjacency=None,
+                 instrument=None):
         """
         Initialize with a list of edges (u, v).
         Assumes U vertices are the first element, V vertices are the second.
+        adjacency can be passed in as (adj_u, adj_v) if it was already built
+        for these edges; the solver only reads it.
+        If checkpoint_path is given, proven-UNSAT k values are saved there
+        (at most once every checkpoint_interval seconds) and a later solver
+        on the same edges resumes from them instead of starting at k=1.
+        instrument (see instrument.py) receives the kernelize / encode / sat
+        phase times, the clause and SAT solver counters and one mark per k.
         """
         self.original_edges = set(tuple(e) for e in edges)
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.last_checkpoint = time.perf_counter()
+        self.unsat_k = set()    # k values proven impossible
+        self.found_k = None     # exact answer once a SAT k has been found
+        self.cover = []         # Biclique records of a minimum cover, filled in with found_k
+        self.kernel_cover = []  # (U, V) pairs of kernel vertices from the last SAT model
+        self.instrument = NULL if instrument is None else instrument
 
         # Extract unique U and V sets
         self.u_nodes = sorted(list(set(u_ for u_, v_ in edges)))
         self.v_nodes = sorted(list(set(v_ for u_, v_ in edges)))
 
         # Build Adjacency Dictionary (for twin reduction)
-        self.adj_u = defaultdict(set)  # Neighbors of U
-        self.adj_v = defaultdict(set)  # Neighbors of V
-
-        for u_, v_ in edges:
-            self.adj_u[u_].add(v_)
-            self.adj_v[v_].add(u_)
+        if adjacency is not None:
+            self.adj_u, self.adj_v = adjacency
+        else:
+            self.adj_u = defaultdict(set)  # Neighbors of U
+            self.adj_v = defaultdict(set)  # Neighbors of V
+
+            for u_, v_ in edges:
+                self.adj_u[u_].add(v_)
+                self.adj_v[v_].add(u_)
+
+    def _graph_signature(self) -> str:
+        """Identifies the input graph so a checkpoint is never resumed on other edges."""
+        return hashlib.sha1(repr(sorted(self.original_edges)).encode()).hexdigest()
+
+    def _load_checkpoint(self):
+        """Restores proven bounds from checkpoint_path, if it belongs to this graph."""
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return
+        with open(self.checkpoint_path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("signature") != self._graph_signature():
+            self.instrument.mark("checkpoint ignored", reason="different graph")
+            return
+        self.unsat_k = set(state["unsat_k"])
+        self.found_k = state["found_k"]
+        self.cover = state.get("cover", [])
+
+    def _save_checkpoint(self, force=False):
+        """Writes proven bounds to checkpoint_path (atomically, via a temp file)."""
+        if self.checkpoint_path is None:
+            return
+        now = time.perf_counter()
+        if not force and (now - self.last_checkpoint) < self.checkpoint_interval:
+            return
+        state = {
+            "signature": self._graph_signature(),
+            "unsat_k": sorted(self.unsat_k),
+            "lower_bound": self.lower_bound(),
+            "found_k": self.found_k,
+            "cover": self.cover,
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+        self.last_checkpoint = now
+
+    def lower_bound(self):
+        """Smallest k not yet ruled out (UNSAT at k implies UNSAT at every smaller k)."""
+        return max(self.unsat_k, default=0) + 1
 
     def _get_signature(self, neighbors: set) -> tuple:
         """Helper to make neighbor sets hashable for twin detection."""
@@ -94,37 +154,51 @@ class BicliqueCoverSolver:
 
         return curr_u, curr_v
 
-    def solve(self, max_k=9):
+    def solve(self, max_k=9, kernel=None):
         """
         Main Loop: Tries k=1, k=2... up to max_k.
+        kernel can be passed in as the (k_u, k_v) result of twin_reduction()
+        to skip kernelization.
         """
-        if print_all:
-            print(f"Original Graph: {len(self.u_nodes)} U-nodes, {len(self.v_nodes)} V-nodes.")
-
-        # 1. Kernelize + timer
-        kernel_start = time.perf_counter()
-        k_u, k_v = self.twin_reduction()
-        kernel_end = time.perf_counter()
-        if print_all:
-            print(f"Kernelization time = {(kernel_end - kernel_start):.6f}s")
-            print(f"Kernel Reduced: {len(k_u)} U-nodes, {len(k_v)} V-nodes.")
+        instrument = self.instrument
+
+        # 1. Kernelize
+        if kernel is None:
+            with instrument.phase("kernelize"):
+                kernel = self.twin_reduction()
+        k_u, k_v = kernel
+        instrument.mark("kernel", u_nodes=len(self.u_nodes), v_nodes=len(self.v_nodes),
+                        kernel_u=len(k_u), kernel_v=len(k_v))
+
+        # Resume from an earlier run on the same graph
+        self._load_checkpoint()
+        if self.found_k is not None:
+            instrument.mark("checkpoint", found_k=self.found_k)
+            return self.found_k
+        if self.unsat_k:
+            instrument.mark("checkpoint", lower_bound=self.lower_bound())
 
         # 2. Iterate k
-        for k in range(1, max_k + 1):
-            # If kernel size > 2^k, it's impossible
+        for k in range(self.lower_bound(), max_k + 1):
+            # If kernel size > 2^k, it's impossible (the kernel rows are distinct, and k bicliques
+            # give at most 2^k distinct rows), so k is skipped and recorded like an UNSAT k
             if len(k_u) > 2 ** k or len(k_v) > 2 ** k:
-                if print_all:
-                    print(f"k={k}: Impossible (Kernel size exceeds 2^k fingerprint limit)")
-                    continue
-            if print_all:
-                print(f"Checking k={k} using SAT...", end=" ")
+                instrument.mark(f"k={k} fingerprint limit")
+                instrument.count("fingerprint_skips")
+                self.unsat_k.add(k)
+                continue
             if self._check_k_sat(k, k_u, k_v):
-                if print_all:
-                    print("SAT! Found exact cover.")
+                instrument.mark(f"k={k} SAT")
+                self.found_k = k
+                self.cover = self.expand_cover(k_u, k_v)
+                self._save_checkpoint(force=True)
                 return k
             else:
-                if print_all:
-                    print("UNSAT.")
+                instrument.mark(f"k={k} UNSAT")
+                self.unsat_k.add(k)
+                self._save_checkpoint()
+
+        self._save_checkpoint(force=True)
 
         return -1  # Not found within max_k
 
@@ -133,7 +207,7 @@ class BicliqueCoverSolver:
         Phase 2 & 3: Encoding and Solving.
         Translates the Kernel factorization into CNF and solves.
         """
-        encode_start = time.perf_counter()
+        instrument = self.instrument
         solver = Minisat22()
 
         m, n = len(active_u), len(active_v)
@@ -141,7 +215,6 @@ class BicliqueCoverSolver:
         # SAT Variable IDs
         # W variables (m rows * k cols): 1 to m*k
         # H variables (k rows * n cols): m*k + 1 to m*k + n*k
-        encode_start = time.perf_counter()
         def w_var(row_idx, biclique_idx):
             return 1 + (row_idx * k) + biclique_idx
 
@@ -150,66 +223,106 @@ class BicliqueCoverSolver:
 
         # Generate clauses
         # Cover the adjacency matrix of the kernel
-        for i, u_node in enumerate(active_u):
-            for j, v_node in enumerate(active_v):
-
-                # Check if edge exists in original data
-                has_edge = v_node in self.adj_u[u_node]
-
-                if not has_edge:
-                    # constraint: For all z, NOT(W_iz AND H_zj)
-                    # CNF: (NOT W_iz OR NOT H_zj)
-                    for z in range(k):
-                        solver.add_clause([-w_var(i, z), -h_var(z, j)])
-
-                else:
-                    # Since k is small, we distribute it: (W1H1 v W2H2...)
-                    # This generates 2^k clauses.
-
-                    # Generate all combinations of choosing either W or H for each biclique
-                    for pattern in itertools.product([0, 1], repeat=k):
-                        clause = []
-                        for z, choice in enumerate(pattern):
-                            # choice 0 -> W, choice 1 -> H
-                            if choice == 0:
-                                clause.append(w_var(i, z))
-                            else:
-                                clause.append(h_var(z, j))
-                        solver.add_clause(clause)
-        encode_end = time.perf_counter()
-        if print_all:
-            print(f"\nEncoding time = {(encode_end - encode_start):.6f}s")
-
-        solver_start = time.perf_counter()
-        is_sat = solver.solve()
-        solver_end = time.perf_counter()
-        if print_all:
-            print(f"Solver time = {(solver_end - solver_start):.6f}s")
+        with instrument.phase("encode"):
+            for i, u_node in enumerate(active_u):
+                for j, v_node in enumerate(active_v):
+
+                    # Check if edge exists in original data
+                    has_edge = v_node in self.adj_u[u_node]
+
+                    if not has_edge:
+                        # constraint: For all z, NOT(W_iz AND H_zj)
+                        # CNF: (NOT W_iz OR NOT H_zj)
+                        for z in range(k):
+                            solver.add_clause([-w_var(i, z), -h_var(z, j)])
+
+                    else:
+                        # Since k is small, we distribute it: (W1H1 v W2H2...)
+                        # This generates 2^k clauses.
+
+                        # Generate all combinations of choosing either W or H for each biclique
+                        for pattern in itertools.product([0, 1], repeat=k):
+                            clause = []
+                            for z, choice in enumerate(pattern):
+                                # choice 0 -> W, choice 1 -> H
+                                if choice == 0:
+                                    clause.append(w_var(i, z))
+                                else:
+                                    clause.append(h_var(z, j))
+                            solver.add_clause(clause)
+
+        with instrument.phase("sat"):
+            is_sat = solver.solve()
+
+        sat_stats = solver.accum_stats()
+        instrument.add_counts({
+            "sat_calls": 1,
+            "variables": solver.nof_vars(),
+            "clauses": solver.nof_clauses(),
+            "conflicts": sat_stats.get("conflicts", 0),
+            "decisions": sat_stats.get("decisions", 0),
+            "propagations": sat_stats.get("propagations", 0),
+        })
+
+        # Bicliques of the kernel: row i is in biclique z if W_iz, column j if H_zj
+        if is_sat:
+            true_vars = {lit for lit in solver.get_model() if lit > 0}
+            self.kernel_cover = []
+            for z in range(k):
+                U = {u_node for i, u_node in enumerate(active_u) if w_var(i, z) in true_vars}
+                V = {v_node for j, v_node in enumerate(active_v) if h_var(z, j) in true_vars}
+                if U and V:
+                    self.kernel_cover.append((U, V))
 
         solver.delete()
         return is_sat
 
-def run_test(graph_name, test_num, actual_k ='?'):
+    def expand_cover(self, k_u, k_v):
+        """
+        Undoes the twin reduction on the kernel cover of the last SAT model:
+        every original vertex joins the bicliques of the kernel vertex with
+        the same neighbors in the kernel (its twin, or itself).
+        """
+        kernel_v = set(k_v)
+        kernel_u = set(k_u)
+        rep_u = {self._get_signature(self.adj_u[u_].intersection(kernel_v)): u_ for u_ in k_u}
+        rep_v = {self._get_signature(self.adj_v[v_].intersection(kernel_u)): v_ for v_ in k_v}
+        twin_of_u = {u_: rep_u[self._get_signature(self.adj_u[u_].intersection(kernel_v))] for u_ in self.u_nodes}
+        twin_of_v = {v_: rep_v[self._get_signature(self.adj_v[v_].intersection(kernel_u))] for v_ in self.v_nodes}
+
+        cover = []
+        for U, V in self.kernel_cover:
+            cover.append(Biclique({u_ for u_ in self.u_nodes if twin_of_u[u_] in U},
+                                  {v_ for v_ in self.v_nodes if twin_of_v[v_] in V}))
+        return cover
+
+def run_test(graph_name, test_num, actual_k ='?', verbose=False):
     """
     Takes a graph's name that's meant to be used on a dictionary of graphs,
     which test iteration number this is,
     and can take the value of the actual k parameter.
+    With verbose, prints the result and the per-phase report of the run.
     """
-    if print_all:
+    import datasets
+    instrument = Instrument(graph_name) if verbose else NULL
+    if verbose:
         print(f"Test #{test_num}: {graph_name = } (Expected k={actual_k})")
-    exact_solver = BicliqueCoverSolver(TEST_DATA[graph_name])
-    if print_all:
-        print(f"Calculated Bipartite Dimension: {exact_solver.solve()}\n")
+    exact_solver = BicliqueCoverSolver(datasets.get(graph_name), instrument=instrument)
+    k = exact_solver.solve()
+    if verbose:
+        print(f"Calculated Bipartite Dimension: {k}")
+        print(instrument.report() + "\n")
 
 def main():
     # Uses toy datasets for testing accuracy of the exact FPT algorithm
+    import datasets
     all_runtimes = []
-    for idx, graph in enumerate(TEST_DATA):
+    for idx, graph in enumerate(datasets.names("test")):
         runtimes = []
         print("=================================================\n")
         for iteration in range(1, 6):
             total_runtime_start = time.perf_counter()
-            run_test(graph, expected_k[idx])
+            run_test(graph, iteration, datasets.expected_k(graph), verbose=True)
             total_runtime_end = time.perf_counter()
             runtimes.append(total_runtime_end - total_runtime_start)
             print(f"Total runtime for test #{iteration}:")
@@ -221,17 +334,19 @@ def main():
         all_runtimes.append(sum(runtimes) / 5)
 
     print("All average runtimes in order of input:")
-    for idx, graph in enumerate(TEST_DATA):
+    for idx, graph in enumerate(datasets.names("test")):
         print(f"{graph} avg time: {all_runtimes[idx]:.8f}")
 
 
-def import_main(dataset):
+def import_main(*groups):
+    # groups: dataset groups of the registry (e.g. "toy"), every group if none are given
+    import datasets
 
-    for idx, graph in enumerate(dataset.graphs):
+    for idx, graph in enumerate(datasets.names(*groups)):
         runtimes = []
         for iteration in range(1, 6):
             total_runtime_start = time.perf_counter()
-            run_test(graph, expected_k[idx], iteration)
+            run_test(graph, iteration, datasets.expected_k(graph))
             total_runtime_end = time.perf_counter()
             runtimes.append(total_runtime_end - total_runtime_start)
             #print(f"Total runtime for test #{iteration}:")
@@ -241,5 +356,4 @@ def import_main(dataset):
         print(f"     {(sum(runtimes) / 5):.8f}s\n")
 
 if __name__ == "__main__":
-    print_all = True
     main()
\ No newline at end of file
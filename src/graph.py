@@ -146,6 +146,14 @@ class Graph:
             for u in e.outgoing():
                 self._E[u].add(e)
         return self
+
+    def remove_edge(self, e : "Graph.Edge") -> "Graph":
+        if e not in self.C:
+            raise KeyError("Edge not found")
+        del self._C[e]
+        for u in e.vertices():
+            self._E[u].discard(e)
+        return self
     
     def adjacent(self, v : int) -> Set[int]:
         return {w for e in self.E[v] for w in e.incoming()} - {v}
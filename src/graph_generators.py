@@ -0,0 +1,317 @@
+"""Parametric bipartite graph families with known bounds on k.
+
+Every generator returns a GeneratedGraph: the family name, its parameters,
+the seed, the number of U and V vertices and the bounds on the bipartite
+dimension that are known from the construction (lower == upper when k is
+known exactly). Edges are streamed, so graphs with millions of edges never
+have to be held as a Python list:
+
+    G = planted_cover(100000, 100000, k=50, side=(20, 200), noise=1000, seed=1)
+    for u, v in G.edges(): ...           # stream, same edges on every pass
+    edges = G.to_list()                  # [(u, v), ...] for the solvers
+    array = G.to_numpy()                 # (m, 2) int64 array (needs numpy)
+
+U vertices are 0..n_u-1 and V vertices n_u..n_u+n_v-1, like the datasets
+in test_graphs.py and difficult_datasets.py (a disjoint union shifts every
+part past the vertices of the one before it); matching, half_graph, crown,
+crown_union and modulo give exactly the edges (in the same order) of the
+generate_* functions there.
+"""
+
+import itertools
+import math
+import random
+import sys
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+Edge = Tuple[int, int]
+
+
+class GeneratedGraph:
+
+    def __init__(self, family: str, params: Dict, seed: Optional[int], n_u: int, n_v: int,
+                 lower: int, upper: int, stream: Callable[[], Iterator[Edge]], m: Optional[int] = None) -> None:
+        self.family = family
+        self.params = params
+        self.seed = seed
+        self.n_u = n_u
+        self.n_v = n_v
+        self.lower = lower      # known bounds on the bipartite dimension
+        self.upper = upper
+        self._stream = stream   # returns a fresh iterator over the edges (seeded, so always the same edges)
+        self._m = m             # number of edges if known without generating them
+
+    @property
+    def exact(self) -> bool:
+        return self.lower == self.upper
+
+    @property
+    def m(self) -> int:
+        if self._m is None:
+            self._m = sum(1 for _ in self._stream())
+        return self._m
+
+    def edges(self) -> Iterator[Edge]:
+        return self._stream()
+
+    def __iter__(self) -> Iterator[Edge]:
+        return self._stream()
+
+    def to_list(self) -> List[Edge]:
+        return list(self._stream())
+
+    def to_numpy(self):
+        """(m, 2) int64 array of the edges."""
+        np = _numpy()
+        flat = np.fromiter(itertools.chain.from_iterable(self._stream()), dtype=np.int64,
+                           count=-1 if self._m is None else 2 * self._m)
+        return flat.reshape(-1, 2)
+
+    def numpy_chunks(self, chunk_size: int = 1 << 20) -> Iterator:
+        """The edges as (<= chunk_size, 2) int64 arrays, for graphs too large for one array."""
+        np = _numpy()
+        stream = self._stream()
+        while True:
+            flat = np.fromiter(itertools.chain.from_iterable(itertools.islice(stream, chunk_size)), dtype=np.int64)
+            if flat.size == 0:
+                return
+            yield flat.reshape(-1, 2)
+
+    def check(self, k: int, exact: bool = False) -> bool:
+        """
+        True if a cover of k bicliques is consistent with the known bounds:
+        never below lower, and for an exact solver never above upper.
+        """
+        return k >= self.lower and (not exact or k <= self.upper)
+
+    def describe(self) -> Dict:
+        """Parameters, seed and bounds as a JSON-friendly dict."""
+        return {"family": self.family, "params": self.params, "seed": self.seed, "n_u": self.n_u, "n_v": self.n_v,
+                "lower": self.lower, "upper": self.upper}
+
+    def __repr__(self) -> str:
+        params = ", ".join(f"{key}={value}" for key, value in self.params.items())
+        bounds = f"k={self.lower}" if self.exact else f"k in [{self.lower}, {self.upper}]"
+        return f"GeneratedGraph({self.family}({params}), seed={self.seed}, {bounds})"
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        print("Error: Library 'numpy' is missing.")
+        print("Please install it running: pip install numpy")
+        sys.exit(1)
+    return numpy
+
+
+def crown_dimension(n: int) -> int:
+    """
+    Bipartite dimension of the crown S_n (de Caen, Gregory and Pullman):
+    the smallest k with C(k, floor(k/2)) >= n. S_1 has no edges.
+    """
+    if n <= 1:
+        return 0
+    k = 1
+    while math.comb(k, k // 2) < n:
+        k += 1
+    return k
+
+
+# --- The existing families (exact k) ---
+
+def matching(n: int) -> GeneratedGraph:
+    """n disjoint edges, k = n (test_graphs.generate_matching_graph)."""
+    def stream():
+        for i in range(n):
+            yield (i, i + n)
+    return GeneratedGraph("matching", {"n": n}, None, n, n, n, n, stream, m=n)
+
+
+def half_graph(n: int) -> GeneratedGraph:
+    """u_i ~ v_j for i <= j, k = n (test_graphs.generate_half_graph)."""
+    def stream():
+        for u in range(n):
+            for v in range(u, n):
+                yield (u, v + n)
+    return GeneratedGraph("half_graph", {"n": n}, None, n, n, n, n, stream, m=n * (n + 1) // 2)
+
+
+def crown(n: int) -> GeneratedGraph:
+    """K_{n,n} minus a perfect matching (difficult_datasets.generate_crown_graph)."""
+    def stream():
+        for u in range(n):
+            for v in range(n):
+                if u != v:
+                    yield (u, v + n)
+    k = crown_dimension(n)
+    return GeneratedGraph("crown", {"n": n}, None, n, n, k, k, stream, m=n * (n - 1))
+
+
+def modulo(n: int, mod_val: int = 3) -> GeneratedGraph:
+    """
+    u_i ~ v_j if (i + j) % mod_val != 0 (difficult_datasets.generate_modulo_graph).
+    Rows with the same i % mod_val have the same neighbors, so one biclique
+    per residue class covers the graph: k <= min(n, mod_val).
+    """
+    def stream():
+        for u in range(n):
+            for v in range(n):
+                if (u + v) % mod_val != 0:
+                    yield (u, v + n)
+    lower = 1 if (n > 1 and mod_val > 1) else 0     # (0, 1) is an edge
+    return GeneratedGraph("modulo", {"n": n, "mod_val": mod_val}, None, n, n, lower, min(n, mod_val), stream)
+
+
+def disjoint_union(*graphs: GeneratedGraph) -> GeneratedGraph:
+    """
+    The graphs side by side, each shifted past the vertices of the ones
+    before it. k is additive over components (a biclique is connected), so
+    the bounds add up.
+    """
+    offsets = list(itertools.accumulate((G.n_u + G.n_v for G in graphs), initial=0))
+
+    def stream():
+        for G, offset in zip(graphs, offsets):
+            for u, v in G.edges():
+                yield (u + offset, v + offset)
+    # U and V ids interleave after the shift, so n_u/n_v count vertices, not an id range
+    known_m = None if any(G._m is None for G in graphs) else sum(G._m for G in graphs)
+    return GeneratedGraph("disjoint_union", {"parts": [G.describe() for G in graphs]},
+                          None, sum(G.n_u for G in graphs), sum(G.n_v for G in graphs),
+                          sum(G.lower for G in graphs), sum(G.upper for G in graphs), stream, m=known_m)
+
+
+def crown_union(*sizes: int, matchings: Tuple[int, ...] = ()) -> GeneratedGraph:
+    """
+    Disjoint crowns S_n for every n in sizes, followed by disjoint matchings,
+    with exact k = sum of the parts. crown_union(5, 5) is
+    difficult_datasets.generate_disjoint_union(5, 5).
+    """
+    G = disjoint_union(*[crown(n) for n in sizes], *[matching(n) for n in matchings])
+    G.family = "crown_union"
+    G.params = {"crowns": list(sizes), "matchings": list(matchings)}
+    return G
+
+
+# --- Random families ---
+
+def random_bipartite(n_u: int, n_v: int, p: float, seed: int = 0) -> GeneratedGraph:
+    """
+    G(n_u, n_v, p): every U-V pair is an edge with probability p. The gaps
+    between edges in row-major order are drawn from the geometric
+    distribution, so generation costs O(m), not O(n_u * n_v).
+    Stars around the smaller side cover the graph: k <= min(n_u, n_v).
+    """
+    def stream():
+        if p <= 0:
+            return
+        rng = random.Random(seed)
+        cells = n_u * n_v
+        log_q = math.log(1.0 - p) if p < 1 else None
+        cell = -1
+        while True:
+            if log_q is None:
+                cell += 1
+            else:
+                cell += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if cell >= cells:
+                return
+            u, v = divmod(cell, n_v)
+            yield (u, n_u + v)
+    return GeneratedGraph("random_bipartite", {"n_u": n_u, "n_v": n_v, "p": p}, seed, n_u, n_v,
+                          0, min(n_u, n_v), stream)
+
+
+def planted_cover(n_u: int, n_v: int, k: int, side: Tuple[int, int] = (2, 10), noise: int = 0,
+                  seed: int = 0) -> GeneratedGraph:
+    """
+    The union of k random bicliques (each side size drawn from `side`)
+    plus `noise` random extra edges. The k planted bicliques and one star
+    per noise vertex on the smaller noise side give k <= upper bound.
+    Overlapping bicliques are not stored: an edge is emitted by the
+    lowest-numbered biclique that contains it.
+    """
+    rng = random.Random(seed)
+    bicliques = []
+    u_in: Dict[int, set] = {}
+    v_in: Dict[int, set] = {}
+    for b in range(k):
+        U = sorted(rng.sample(range(n_u), min(n_u, rng.randint(*side))))
+        V = sorted(rng.sample(range(n_v), min(n_v, rng.randint(*side))))
+        bicliques.append((U, V))
+        for u in U:
+            u_in.setdefault(u, set()).add(b)
+        for v in V:
+            v_in.setdefault(v, set()).add(b)
+
+    noise_edges = set()
+    attempts = 0
+    while len(noise_edges) < noise and attempts < 20 * noise:
+        attempts += 1
+        u, v = rng.randrange(n_u), rng.randrange(n_v)
+        if not (u_in.get(u, set()) & v_in.get(v, set())):
+            noise_edges.add((u, v))
+    noise_edges = sorted(noise_edges)
+    noise_stars = min(len({u for u, _ in noise_edges}), len({v for _, v in noise_edges}))
+
+    def stream():
+        for b, (U, V) in enumerate(bicliques):
+            for u in U:
+                for v in V:
+                    if min(u_in[u] & v_in[v]) == b:
+                        yield (u, n_u + v)
+        for u, v in noise_edges:
+            yield (u, n_u + v)
+    return GeneratedGraph("planted_cover", {"n_u": n_u, "n_v": n_v, "k": k, "side": list(side), "noise": noise},
+                          seed, n_u, n_v, 1 if (k or noise_edges) else 0, k + noise_stars, stream)
+
+
+def power_law_bipartite(n_u: int, n_v: int, m: int, exponent: float = 2.5, seed: int = 0) -> GeneratedGraph:
+    """
+    Chung-Lu style bipartite graph with about m edges whose expected degrees
+    follow a power law with the given exponent on both sides: vertex i has
+    weight (i + 1)^(-1 / (exponent - 1)). Every U vertex draws its degree
+    from its share of m, then that many distinct V neighbors by weight, so
+    only one neighborhood is in memory at a time.
+    k <= min(n_u, n_v) (stars).
+    """
+    def weights(n):
+        return [(i + 1) ** (-1.0 / (exponent - 1.0)) for i in range(n)]
+
+    def stream():
+        rng = random.Random(seed)
+        w_u = weights(n_u)
+        total_u = sum(w_u)
+        w_v = weights(n_v)
+        cum_v = list(itertools.accumulate(w_v))
+        total_v = cum_v[-1]
+        for u in range(n_u):
+            expected = m * w_u[u] / total_u
+            degree = min(n_v, int(expected) + (1 if rng.random() < expected - int(expected) else 0))
+            if degree * 2 > n_v:
+                # dense row: weighted sampling without replacement (largest random keys r^(1/w))
+                keyed = sorted(range(n_v), key=lambda v: rng.random() ** (1.0 / w_v[v]))
+                neighbors = sorted(keyed[-degree:]) if degree else []
+            else:
+                chosen = set()
+                while len(chosen) < degree:
+                    chosen.add(min(bisect_left(cum_v, rng.random() * total_v), n_v - 1))
+                neighbors = sorted(chosen)
+            for v in neighbors:
+                yield (u, n_u + v)
+    return GeneratedGraph("power_law_bipartite", {"n_u": n_u, "n_v": n_v, "m": m, "exponent": exponent},
+                          seed, n_u, n_v, 0, min(n_u, n_v), stream)
+
+
+if __name__ == "__main__":
+    import time
+
+    for G in (crown(11), crown_union(5, 5, matchings=(4,)), modulo(10),
+              random_bipartite(2000, 2000, 0.25, seed=1),
+              planted_cover(100000, 100000, k=200, side=(50, 150), noise=10000, seed=1),
+              power_law_bipartite(200000, 200000, 1000000, seed=1)):
+        start = time.perf_counter()
+        m = sum(1 for _ in G.edges())
+        print(f"{G}: {m} edges streamed in {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,226 @@
+"""Per-phase instrumentation for the solvers.
+
+Every solver takes an optional `instrument` and reports into it:
+
+    with instrument.phase("encode"):      # wall time, summed per phase name (phases may nest)
+        ...
+    instrument.count("clauses", n)        # counters, summed per name
+    instrument.mark("k=3 UNSAT")          # instant events, only shown in the trace
+
+Solvers count inner-loop work in local variables and report the totals once
+per phase or per run, so an enabled Instrument costs a few dict updates per
+phase. NULL (the default everywhere) is a disabled instrument whose methods
+do nothing, so solvers never have to check whether they are instrumented.
+
+What was collected exports as a JSON-ready dict (to_dict, write_json) or as
+Chrome trace events (trace_events, write_trace; open the file in
+chrome://tracing or https://ui.perfetto.dev).
+
+With profile_interval set, a sampling profiler thread runs while a top-level
+phase is open: every profile_interval seconds it looks at the instrumented
+thread's stack and counts the innermost function, which shows where the time
+inside a phase goes without a tracing profiler's overhead.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+
+class SamplingProfiler:
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()    # "file:function" of the innermost frame -> number of samples
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                code = frame.f_code
+                self.samples[f"{os.path.basename(code.co_filename)}:{code.co_name}"] += 1
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+class Instrument:
+
+    enabled = True
+
+    def __init__(self, name=None, profile_interval=None, max_events=100000):
+        self.name = name
+        self.phases = {}            # phase name -> total seconds
+        self.calls = {}             # phase name -> times entered
+        self.counters = {}
+        self.events = []            # (phase name, start, seconds, depth), start relative to creation
+        self.marks = []             # (name, time, args), time relative to creation
+        self.dropped_events = 0     # phases beyond max_events are only summed, not kept for the trace
+        self.max_events = max_events
+        self.profile_interval = profile_interval
+        self.samples = Counter()
+        self._origin = time.perf_counter()
+        self._depth = 0
+        self._profiler = None
+
+    @contextmanager
+    def phase(self, name):
+        if self._depth == 0 and self.profile_interval:
+            self._profiler = SamplingProfiler(threading.get_ident(), self.profile_interval)
+            self._profiler.start()
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depth -= 1
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if len(self.events) < self.max_events:
+                self.events.append((name, start - self._origin, elapsed, self._depth))
+            else:
+                self.dropped_events += 1
+            if self._depth == 0 and self._profiler is not None:
+                self._profiler.stop()
+                self.samples.update(self._profiler.samples)
+                self._profiler = None
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_counts(self, counts):
+        for name, n in counts.items():
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def mark(self, name, **args):
+        if len(self.marks) < self.max_events:
+            self.marks.append((name, time.perf_counter() - self._origin, args))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "phases": dict(self.phases),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+            "samples": dict(self.samples.most_common()),
+            "dropped_events": self.dropped_events,
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def trace_events(self, pid=None, tid=0):
+        """Chrome trace events: one complete event per phase, instant events for marks, the counters at the end."""
+        pid = os.getpid() if pid is None else pid
+        events = []
+        if self.name is not None:
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": self.name}})
+        end = 0.0
+        for name, start, elapsed, depth in self.events:
+            events.append({"name": name, "cat": "phase", "ph": "X", "pid": pid, "tid": tid,
+                           "ts": start * 1e6, "dur": elapsed * 1e6, "args": {"depth": depth}})
+            end = max(end, start + elapsed)
+        for name, at, args in self.marks:
+            events.append({"name": name, "cat": "mark", "ph": "i", "s": "t", "pid": pid, "tid": tid,
+                           "ts": at * 1e6, "args": args})
+            end = max(end, at)
+        if self.counters:
+            events.append({"name": "counters", "ph": "C", "pid": pid, "tid": tid, "ts": end * 1e6,
+                           "args": dict(self.counters)})
+        return events
+
+    def write_trace(self, path, pid=None, tid=0):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events(pid, tid), "displayTimeUnit": "ms"}, f)
+
+    def report(self):
+        """Human-readable summary: phases by total time, then counters and the most sampled functions."""
+        lines = []
+        for name, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<24} {seconds:.6f}s  ({self.calls[name]} call(s))")
+        for name, n in self.counters.items():
+            lines.append(f"  {name:<24} {n}")
+        total = sum(self.samples.values())
+        for location, n in self.samples.most_common(5):
+            lines.append(f"  {location:<40} {n / total:.1%} of {total} samples")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"Instrument({self.name or 'unnamed'}, phases={len(self.phases)}, counters={len(self.counters)})"
+
+
+class NullInstrument:
+    # disabled instrument: same interface, nothing is collected
+
+    enabled = False
+    name = None
+    _null_phase = nullcontext()
+
+    # fresh empty collections on every access: NULL is shared by every uninstrumented run, so nothing
+    # a caller does to what it reads here may leak into the next run
+    @property
+    def phases(self):
+        return {}
+
+    @property
+    def calls(self):
+        return {}
+
+    @property
+    def counters(self):
+        return {}
+
+    @property
+    def samples(self):
+        return Counter()
+
+    def phase(self, name):
+        return self._null_phase
+
+    def count(self, name, n=1):
+        pass
+
+    def add_counts(self, counts):
+        pass
+
+    def mark(self, name, **args):
+        pass
+
+    def to_dict(self):
+        return {}
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump({}, f)
+
+    def trace_events(self, pid=None, tid=0):
+        return []
+
+    def write_trace(self, path, pid=None, tid=0):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": []}, f)
+
+    def report(self):
+        return ""
+
+    def __repr__(self):
+        return "NullInstrument()"
+
+
+NULL = NullInstrument()
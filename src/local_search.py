@@ -0,0 +1,253 @@
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from graph import Graph
+from bipartite import Biclique
+from approx_biclique_cover import converge, edge_key, EdgeKey
+from collections import defaultdict
+from itertools import count
+import random
+import time
+
+
+class LocalSearch:
+    # Anytime improvement of a biclique cover of G. Moves never make the cover larger, so the current cover is always
+    # the best one found and can be returned whenever the time budget runs out:
+    #   grow:       every biclique is closed to a maximal biclique of G (more edges, same count)
+    #   redundant:  bicliques whose edges are all covered by other bicliques are dropped
+    #   absorb:     a biclique is dropped if each edge only it covered can be added to another biclique by extending
+    #               that biclique with one endpoint of the edge (swapping out the vertices not adjacent to it; the edges
+    #               that uncovers are re-covered the same way)
+    #   repair:     two or three bicliques sharing vertices are dropped and the edges only they covered are re-covered
+    #               greedily with maximal bicliques of G grown from those edges; kept if that takes fewer bicliques
+
+    def __init__(self, G: Graph, cover: Iterable, rng: Optional[random.Random] = None) -> None:
+        self._rng = random.Random() if (rng is None) else rng
+        self._N : Dict[int, Set[int]] = defaultdict(set)
+        for e in G.C.keys():
+            u, v = e.vertices()
+            if u != v:
+                self._N[u].add(v)
+                self._N[v].add(u)
+
+        self._bicliques : Dict[int, Biclique] = {}
+        self._member_of : Dict[int, Set[int]] = defaultdict(set)
+        self._covering : Dict[EdgeKey, int] = defaultdict(int)     # number of bicliques covering every edge
+        self._ids = count()
+        for B in cover:
+            self._add(Biclique(B.U, B.V))
+
+        self.moves = defaultdict(int)       # accepted moves by kind
+
+    @property
+    def k(self) -> int:
+        return len(self._bicliques)
+
+    @property
+    def cover(self) -> List[Biclique]:
+        return list(self._bicliques.values())
+
+    def _add(self, B: Biclique, b: Optional[int] = None) -> int:
+        # b: the id to reuse when a biclique is put back
+        b = next(self._ids) if (b is None) else b
+        self._bicliques[b] = B
+        for w in (*B.U, *B.V):
+            self._member_of[w].add(b)
+        for u, v in B.edges():
+            self._covering[edge_key(u, v)] += 1
+        return b
+
+    def _remove(self, b: int) -> Biclique:
+        B = self._bicliques.pop(b)
+        for w in (*B.U, *B.V):
+            self._member_of[w].discard(b)
+        for u, v in B.edges():
+            self._covering[edge_key(u, v)] -= 1
+        return B
+
+    def _only_covered_by(self, B: Biclique) -> List[EdgeKey]:
+        # edges of B (still in the cover) that no other biclique covers
+        return [e for e in map(lambda uv: edge_key(*uv), B.edges()) if self._covering[e] == 1]
+
+    def _common_neighbors(self, S: Iterable[int]) -> Set[int]:
+        return set.intersection(*[self._N[w] for w in S])
+
+    def grow(self) -> int:
+        # closes every biclique to a maximal one, growing whichever side gives more edges first
+        grown = 0
+        for b in list(self._bicliques):
+            B = self._bicliques[b]
+            L_first = self._common_neighbors(B.V)
+            by_U = Biclique(L_first, self._common_neighbors(L_first))
+            R_first = self._common_neighbors(B.U)
+            by_V = Biclique(self._common_neighbors(R_first), R_first)
+            best = max(by_U, by_V, key=lambda C: C.m)
+            if best.m > B.m:
+                self._remove(b)
+                self._add(best)
+                grown += 1
+        self.moves["grow"] += grown
+        return grown
+
+    def remove_redundant(self) -> int:
+        removed = 0
+        for b in sorted(self._bicliques, key=lambda b: self._bicliques[b].m):
+            if not self._only_covered_by(self._bicliques[b]):
+                self._remove(b)
+                removed += 1
+        self.moves["redundant"] += removed
+        return removed
+
+    def absorb(self, b: int, max_steps: Optional[int] = None) -> bool:
+        # drops b and re-covers every edge only it covered by extending another biclique with one endpoint of the edge;
+        # an extension may swap out the vertices of the extended side that are not adjacent to the new endpoint, and
+        # the edges only those covered are re-covered the same way. The move fails and the cover is restored when an
+        # edge cannot be re-covered or after max_steps extensions (default: twice the edges only b covered, plus 4),
+        # with the same ids as before
+        B = self._bicliques[b]
+        pending = self._only_covered_by(B)
+        self._remove(b)
+        max_steps = (2 * len(pending) + 4) if (max_steps is None) else max_steps
+        added : Set[int] = set()             # ids of the bicliques this move put into the cover (and still there)
+        replaced : List[Tuple[int, Biclique]] = []      # (id, biclique) of the bicliques of the cover it took out
+        steps = 0
+
+        while pending:
+            e = pending.pop()
+            if self._covering[e] > 0:
+                continue                              # covered by an earlier extension of this move
+            extension = self._best_extension(*e) if (steps < max_steps) else None
+            if extension is None:
+                for c in added:
+                    self._remove(c)
+                for c, C in replaced:
+                    self._add(C, c)
+                self._add(B, b)
+                return False
+            steps += 1
+            c, C_new = extension
+            C_old = self._remove(c)
+            if c in added:
+                added.discard(c)
+            else:
+                replaced.append((c, C_old))
+            added.add(self._add(C_new))
+            pending.extend(f for f in map(lambda uv: edge_key(*uv), C_old.edges()) if self._covering[f] == 0)
+
+        self.moves["absorb"] += 1
+        return True
+
+    def _best_extension(self, u: int, v: int) -> Optional[Tuple[int, Biclique]]:
+        # a biclique containing u (or v) extended by the other endpoint: the vertices on the side of the endpoint it
+        # contains that are not adjacent to the new one are swapped out; the extension uncovering the fewest edges
+        # wins, then the largest one
+        best, best_key = None, None
+        for x, y in ((u, v), (v, u)):
+            for c in self._member_of[x]:
+                C = self._bicliques[c]
+                side_is_U = x in C.U
+                side, other = (C.U, C.V) if side_is_U else (C.V, C.U)
+                if y in side:
+                    continue
+                kept = side & self._N[y]
+                lost = sum(1 for w in side - kept for z in other if self._covering[edge_key(w, z)] == 1)
+                C_new = Biclique(kept, other | {y}) if side_is_U else Biclique(other | {y}, kept)
+                key = (lost, -C_new.m)
+                if (best_key is None) or (key < best_key):
+                    best, best_key = (c, C_new), key
+        return best
+
+    def _closure(self, R: Set[int]) -> Biclique:
+        # the maximal biclique of G containing L x R for any L that R is complete to: the common neighbors of R,
+        # then the common neighbors of those
+        L = self._common_neighbors(R)
+        return Biclique(L, self._common_neighbors(L))
+
+    def repair(self, b: int, size: int = 2) -> bool:
+        # drops b and up to size-1 bicliques sharing a vertex with it, then re-covers the edges nothing else covers
+        # greedily with maximal bicliques of G grown from those edges (they may overlap the rest of the cover)
+        B = self._bicliques[b]
+        neighbors = sorted({c for w in (*B.U, *B.V) for c in self._member_of[w]} - {b})
+        if not neighbors:
+            return False
+        cluster = [b] + self._rng.sample(neighbors, min(size - 1, len(neighbors)))
+        removed = [self._remove(c) for c in cluster]
+        freed = {e for C in removed for e in map(lambda uv: edge_key(*uv), C.edges()) if self._covering[e] == 0}
+
+        N_freed : Dict[int, Set[int]] = defaultdict(set)
+        for u, v in freed:
+            N_freed[u].add(v)
+            N_freed[v].add(u)
+        candidates = set()
+        for u, v in freed:
+            for x, y in ((u, v), (v, u)):
+                candidates.add(self._closure({y}))
+                L, R = converge(N_freed, x, y)
+                if L and R:
+                    candidates.add(self._closure(R))
+
+        replacement = []
+        left = set(freed)
+        while left and (len(replacement) < len(removed) - 1):
+            best = max(candidates, key=lambda C: sum(1 for u, v in left if C.covers(u, v)))
+            replacement.append(best)
+            left = {(u, v) for u, v in left if not best.covers(u, v)}
+
+        if not left:
+            for C in replacement:
+                self._add(C)
+            self.moves["repair"] += 1
+            return True
+        for C in removed:
+            self._add(C)
+        return False
+
+    def run(self, time_budget: float = 1.0, lower_bound: int = 0, patience: Optional[int] = None) -> List[Biclique]:
+        # improves until the time budget is spent, the cover reaches lower_bound, or `patience` moves in a row
+        # (default: 4 per biclique) fail
+        deadline = time.perf_counter() + time_budget
+        self.grow()
+        self.remove_redundant()
+        failures = 0
+
+        while (self.k > lower_bound) and (time.perf_counter() < deadline):
+            if failures >= (4 * self.k if (patience is None) else patience):
+                break
+            # small bicliques are the likeliest to be absorbed, so they are tried more often
+            ids = list(self._bicliques)
+            weights = [1.0 / self._bicliques[b].m for b in ids]
+            b = self._rng.choices(ids, weights)[0]
+            move = self._rng.random()
+            if move < 0.4:
+                improved = self.absorb(b)
+            else:
+                improved = self.repair(b, 2 if (move < 0.8) else 3)
+            if improved:
+                self.grow()
+                self.remove_redundant()
+                failures = 0
+            else:
+                failures += 1
+
+        return self.cover
+
+
+def improve_cover(G: Graph, cover: Iterable, time_budget: float = 1.0, lower_bound: int = 0,
+                  rng: Optional[random.Random] = None) -> List[Biclique]:
+    return LocalSearch(G, cover, rng).run(time_budget, lower_bound)
+
+
+if __name__ == "__main__":
+    from cover_verifier import verify_cover
+    from approx_biclique_cover import approx_biclique_cover
+
+    rng = random.Random(0)
+    for file in ("test1", "test2", "test4"):
+        G = Graph.from_file(f"../test/test_data/{file}", Graph.Edge)
+        start = time.perf_counter()
+        cover = list(approx_biclique_cover(G, rng=rng))
+        middle = time.perf_counter()
+        search = LocalSearch(G, cover, rng)
+        improved = search.run(time_budget=1.0)
+        stop = time.perf_counter()
+        print(f"{file}: greedy k={len(cover)} ({middle - start:.3f}s) -> local search k={len(improved)} ({stop - middle:.3f}s), "
+              f"moves={dict(search.moves)}, valid: {verify_cover(G, improved)}")
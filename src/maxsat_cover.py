@@ -0,0 +1,143 @@
+"""Exact minimum biclique cover as one MaxSAT optimization.
+
+Instead of probing k = 1, 2, ... like exact_algo, the maximal bicliques are
+enumerated once (custom/kevin_DP_algo.BicliqueGenerator) and a minimum set
+cover of the edges by those bicliques is found with RC2:
+    hard:  every edge is covered by at least one selected biclique
+    soft:  (NOT x_b) with weight 1 for every biclique b
+Every biclique of a cover can be grown to a maximal one, so the optimum over
+maximal bicliques is the bipartite dimension.
+"""
+
+import sys
+import threading
+import time
+
+from custom.kevin_DP_algo import BicliqueGenerator
+from bipartite import Biclique
+from instrument import NULL
+
+try:
+    from pysat.formula import WCNF
+    from pysat.card import CardEnc, EncType
+    from pysat.examples.rc2 import RC2
+except ImportError:
+    print("Error: Library 'python-sat' is missing.")
+    print("Please install it running: pip install python-sat")
+    sys.exit(1)
+
+
+class MaxSATCoverSolver:
+
+    def __init__(self, edges, biclique_masks=None, instrument=None):
+        """
+        Initialize with a list of edges (u, v), U vertices first.
+        biclique_masks can be passed in if they were already enumerated
+        (bit i of a mask = edge i of the list).
+        instrument (see instrument.py) receives the enumerate / encode /
+        maxsat phases and the bicliques enumerated and clauses encoded.
+        """
+        self.instrument = NULL if instrument is None else instrument
+        self.edges = [tuple(edge) for edge in edges]
+        self.num_edges = len(self.edges)
+        if biclique_masks is None:
+            with self.instrument.phase("enumerate"):
+                biclique_masks = BicliqueGenerator(edges).find_maximal_bicliques()
+        self.biclique_masks = biclique_masks
+        self.instrument.count("bicliques_enumerated", len(biclique_masks))
+        self.cover = []     # bicliques of the optimal cover, filled in by solve()
+
+    def build_model(self, upper_bound=None):
+        """
+        Builds the weighted MaxSAT model. Variable b+1 selects biclique b.
+        If upper_bound is given (e.g. from a heuristic cover), an at-most-k
+        cardinality constraint over the selectors is added as hard clauses.
+        """
+        wcnf = WCNF()
+        num_vars = len(self.biclique_masks)
+
+        # Hard: each edge is covered by a selected biclique
+        covering = [[] for _ in range(self.num_edges)]
+        for b, mask in enumerate(self.biclique_masks):
+            while mask:
+                low_bit = mask & -mask
+                covering[low_bit.bit_length() - 1].append(b + 1)
+                mask ^= low_bit
+        for clause in covering:
+            wcnf.append(clause)
+
+        # Hard (optional): at most upper_bound bicliques
+        if upper_bound is not None and num_vars > upper_bound:
+            card = CardEnc.atmost(lits=list(range(1, num_vars + 1)), bound=upper_bound,
+                                  top_id=num_vars, encoding=EncType.seqcounter)
+            for clause in card.clauses:
+                wcnf.append(clause)
+
+        # Soft: prefer not to use each biclique
+        for b in range(num_vars):
+            wcnf.append([-(b + 1)], weight=1)
+
+        return wcnf
+
+    def solve(self, upper_bound=None, time_limit=None):
+        """
+        Returns the minimum biclique cover number (-1 if upper_bound is too
+        small, or if RC2 is still searching after time_limit seconds and is
+        interrupted), and stores the cover itself in self.cover as a list of
+        Biclique records.
+        """
+        if self.num_edges == 0:
+            self.cover = []
+            return 0
+
+        instrument = self.instrument
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        with instrument.phase("encode"):
+            wcnf = self.build_model(upper_bound)
+        instrument.add_counts({"hard_clauses": len(wcnf.hard), "soft_clauses": len(wcnf.soft)})
+
+        with instrument.phase("maxsat"), RC2(wcnf) as rc2:
+            timer = None
+            if deadline is not None:
+                timer = threading.Timer(max(0.0, deadline - time.perf_counter()), rc2.interrupt)
+                timer.start()
+            try:
+                model = rc2.compute(expect_interrupt=timer is not None)
+            finally:
+                if timer is not None:
+                    timer.cancel()
+            if rc2.interrupted:
+                instrument.mark("time limit", seconds=time_limit)
+        if model is None:
+            self.cover = []
+            return -1
+
+        self.cover = []
+        for b, mask in enumerate(self.biclique_masks):
+            if model[b] > 0:
+                U, V = set(), set()
+                for idx in range(self.num_edges):
+                    if (mask >> idx) & 1:
+                        U.add(self.edges[idx][0])
+                        V.add(self.edges[idx][1])
+                self.cover.append(Biclique(U, V))
+        return len(self.cover)
+
+
+def benchmark(timeout=60.0):
+    """
+    Compares the MaxSAT engine with both existing exact solvers on every
+    dataset in the repo, through benchmark.py: each solver/dataset cell runs
+    in a child process that is stopped once a run takes longer than timeout
+    seconds, so a hard instance (the larger crowns take a long time with the
+    SAT prober and the DP) cannot block the rest of the table.
+    """
+    import benchmark as harness
+
+    harness.main(["--solvers", "maxsat", "kevin_sat", "kevin_dp", "--warmup", "0", "--repeat", "1",
+                  "--timeout", str(timeout)])
+
+
+if __name__ == "__main__":
+    # Run from src/: python3 maxsat_cover.py [timeout per run in seconds]
+    benchmark(float(sys.argv[1]) if len(sys.argv) > 1 else 60.0)
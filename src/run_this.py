@@ -1,17 +1,17 @@
-import time
 import statistics
 
-import exact_algo
-import approx_biclique_cover
-import ApproximationJared
+import solvers
 
-import test_graphs as dd
+import datasets
 from graph import Graph
+from cover_verifier import verify_cover
 
 
 def edges_to_matrix(edges):
     """
     Converts list of tuples [(u, v)...] to Adjacency Matrix.
+    Dense (max id + 1)^2, kept for code that wants a plain matrix;
+    the solvers use the compact Biadjacency instead.
     """
     if not edges:
         return []
@@ -51,85 +51,87 @@ def edges_to_graph_obj(edges):
     return G
 
 
-# Wrappers
+# Wrappers (one Instance per call; main() shares one Instance across solvers and repetitions)
 
 def run_kevin(edges):
     """
     Wrapper for Kevin's Exact Solver.
+    Returns (k, cover).
     """
-    # Create solver instance
-    solver = exact_algo.BicliqueCoverSolver(edges)
     # Run with a high max_k limit (15) so it doesn't error out on Hard graphs (k=9)
-    return solver.solve(max_k=15)
+    result = solvers.solve("kevin_sat", solvers.Instance(edges), solvers.Budget(max_k=15))
+    return result.k, result.cover
 
 
 def run_tate(edges):
     """
     Wrapper for Tate's Greedy Approximation.
+    Returns (k, cover).
     """
-    # 1. Convert Data to Graph Object
-    G = edges_to_graph_obj(edges)
-    # 2. Run Algorithm
-    return approx_biclique_cover.approx_biclique_cover_number(G)
+    result = solvers.solve("tate_greedy", solvers.Instance(edges))
+    return result.k, result.cover
 
 
 def run_jared(edges):
     """
     Wrapper for Jared's Matrix Approximation.
+    Returns (k, cover).
     """
-    # 1. Convert Data to Matrix
-    matrix = edges_to_matrix(edges)
-    # 2. Run Algorithm
-    return ApproximationJared.bipartite(matrix)
+    result = solvers.solve("jared_matrix", solvers.Instance(edges))
+    return result.k, result.cover
 
 
 
 def main():
     # Driver code
-    algorithms = {
-        "Kevin (Exact)": run_kevin,
-        "Tate (Greedy)": run_tate,
-        "Jared (Matrix)": run_jared
-    }
+    algorithms = ["kevin_sat", "tate_greedy", "jared_matrix"]
 
     graphs_to_test = {
-        "Easy (Matching 6)": dd.TEST_DATA["Easy_Matching_6"],
-        "Medium (Matching 8)": dd.TEST_DATA["Medium_Matching_8"],
-        "Hard (Matching 9)": dd.TEST_DATA["Hard_Dense_Half_9"]
+        "Easy (Matching 6)": datasets.get("Easy_Matching_6"),
+        "Medium (Matching 8)": datasets.get("Medium_Matching_8"),
+        "Hard (Matching 9)": datasets.get("Hard_Dense_Half_9")
     }
+    # Each graph is converted (Graph object, matrix, kernel, ...) once, outside the timed runs
+    instances = {graph_name: solvers.Instance(edges, graph_name) for graph_name, edges in graphs_to_test.items()}
+    budget = solvers.Budget(max_k=15)
 
-    print(f"{'ALGORITHM':<20} | {'DATASET':<20} | {'AVG TIME (s)':<12} | {'RESULT (k)':<10}")
-    print("-" * 75)
+    print(f"{'ALGORITHM':<20} | {'DATASET':<20} | {'AVG TIME (s)':<12} | {'RESULT (k)':<10} | COVER")
+    print("-" * 100)
 
-    for algo_name, algo_func in algorithms.items():
+    for algo_name in algorithms:
+        solver = solvers.SOLVERS[algo_name]
 
-        for graph_name, edges in graphs_to_test.items():
+        for graph_name, instance in instances.items():
 
             run_times = []
             results = []
+            cover = None
 
-            # Run 5 times for average
+            # Run up to 5 times for average (fewer once a row has taken 10 s, so a slow exact solve runs once or twice)
             for i in range(5):
-                t_start = time.perf_counter()
-
+                if sum(run_times) > 10.0:
+                    break
                 try:
-                    k = algo_func(edges)
+                    result = solver.solve(instance, budget)
+                    k, cover = result.k, result.cover
+                    run_times.append(result.timings["solve"])
                 except Exception as e:
                     # Catch errors so one crash doesn't stop everything
-                    k = "ERR"
+                    k, cover = "ERR", None
 
-                t_end = time.perf_counter()
-
-                run_times.append(t_end - t_start)
                 results.append(k)
 
-            avg_time = statistics.mean(run_times)
+            avg_time = statistics.mean(run_times) if run_times else float("nan")
 
             final_k = results[-1]
+            runs = f" ({len(results)} run(s))" if len(results) < 5 else ""
+
+            # Check the cover of the last run (if the algorithm reports one)
+            verdict = "n/a" if cover is None else verify_cover(instance.edges, cover)
 
-            print(f"{algo_name:<20} | {graph_name:<20} | {avg_time:.6f}s    | k={final_k}")
+            print(f"{solver.label:<20} | {graph_name:<20} | {avg_time:.6f}s    | k={final_k:<8} | {verdict}{runs}")
 
-        print("-" * 75)
+        print("-" * 100)
 
 
 if __name__ == "__main__":
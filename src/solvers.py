@@ -0,0 +1,290 @@
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from graph import Graph
+from biadjacency import Biadjacency
+from instrument import Instrument
+import random
+import time
+
+# One interface for every biclique cover algorithm in the repo: solve(instance, budget) -> SolveResult.
+# An Instance holds one input graph and builds each representation the algorithms work on (Graph object, packed
+# biadjacency, adjacency dicts, twin-reduced kernel, maximal biclique masks) the first time a solver asks for it, then
+# keeps it for every later solver and repetition, so conversions are paid once instead of inside every timed run.
+# The exact solvers and the DP need python-sat / the custom modules, so they are only imported when they are run.
+# Every run reports its phases and counters into an instrument.Instrument, which ends up in SolveResult.instrument
+# (pass instrument.NULL to collect nothing).
+
+
+Edge = Tuple[int, int]
+
+
+class Instance:
+
+    def __init__(self, edges, name : Optional[str] = None) -> None:
+        # edges: (u, v) pairs, U vertex first (the convention of every dataset in the repo); duplicates are dropped
+        self.name = name
+        self._edges : List[Edge] = list(dict.fromkeys(tuple(edge) for edge in edges))
+        self._cache : Dict[str, object] = {}
+        self.build_times : Dict[str, float] = {}    # seconds spent building each representation
+
+    def _get(self, key : str, build : Callable[[], object]) -> object:
+        if key not in self._cache:
+            start = time.perf_counter()
+            self._cache[key] = build()
+            self.build_times[key] = time.perf_counter() - start
+        return self._cache[key]
+
+    @property
+    def edges(self) -> List[Edge]:
+        return self._edges
+
+    @property
+    def m(self) -> int:
+        return len(self._edges)
+
+    @property
+    def graph(self) -> Graph:
+        # Graph object for Tate's heuristics; solvers must not modify it
+        def build() -> Graph:
+            G = Graph()
+            G.add_vertex(*{w for edge in self._edges for w in edge})
+            for u, v in self._edges:
+                G.add_edge(Graph.Edge(u, v))
+            return G
+        return self._get("graph", build)
+
+    @property
+    def biadjacency(self) -> Biadjacency:
+        return self._get("biadjacency", lambda: Biadjacency(self._edges))
+
+    @property
+    def adjacency(self) -> Tuple[Dict[int, Set[int]], Dict[int, Set[int]]]:
+        # (adj_u, adj_v): neighbors of every U vertex and of every V vertex
+        def build():
+            adj_u, adj_v = defaultdict(set), defaultdict(set)
+            for u, v in self._edges:
+                adj_u[u].add(v)
+                adj_v[v].add(u)
+            return adj_u, adj_v
+        return self._get("adjacency", build)
+
+    @property
+    def kernel(self) -> Tuple[List[int], List[int]]:
+        # (k_u, k_v): U and V vertices left after twin reduction
+        def build():
+            import exact_algo
+            return exact_algo.BicliqueCoverSolver(self._edges, adjacency=self.adjacency).twin_reduction()
+        return self._get("kernel", build)
+
+    @property
+    def biclique_masks(self) -> List[int]:
+        # maximal bicliques as edge bitmasks (bit i = edge i of self.edges)
+        def build():
+            from custom.kevin_DP_algo import BicliqueGenerator
+            return BicliqueGenerator(self._edges).find_maximal_bicliques()
+        return self._get("biclique_masks", build)
+
+    @property
+    def lower_bound(self) -> int:
+        # max of two cheap bounds:
+        #   an induced matching (found greedily) needs one biclique per edge
+        #   vertices of one side with different neighborhoods lie in different non-empty sets of bicliques, so
+        #   their number is below 2^k (the fingerprint bound exact_algo uses on the kernel)
+        def build() -> int:
+            adj_u, adj_v = self.adjacency
+            blocked : Set[int] = set()
+            matching = 0
+            for u, v in self._edges:
+                if (u not in blocked) and (v not in blocked):
+                    matching += 1
+                    blocked.update(adj_u[u], adj_v[v])
+            classes = max(len({frozenset(N) for N in adj.values()}) for adj in (adj_u, adj_v)) if self._edges else 0
+            return max(matching, classes.bit_length())
+        return self._get("lower_bound", build)
+
+    def __repr__(self) -> str:
+        return f"Instance({self.name or 'unnamed'}, m={self.m})"
+
+
+class Budget:
+
+    def __init__(self, max_k : int = 15, seed : Optional[int] = None, time_limit : Optional[float] = None) -> None:
+        self.max_k = max_k      # largest k the exact SAT solver tries before giving up
+        self.seed = seed        # seed of the randomized heuristics, None for a fresh random seed
+        self.time_limit = time_limit    # seconds the MaxSAT solver may search before giving up, None for no limit
+
+    def rng(self) -> random.Random:
+        return random.Random(self.seed)
+
+    def __repr__(self) -> str:
+        return f"Budget(max_k={self.max_k}, seed={self.seed}, time_limit={self.time_limit})"
+
+
+class SolveResult:
+
+    def __init__(self, solver : str, k : Optional[int], cover : Optional[list], lower : int, upper : Optional[int],
+                 timings : Dict[str, float], instrument = None) -> None:
+        self.solver = solver
+        self.k = k                      # None if the solver gave up within its budget
+        self.cover = cover              # list of Biclique records, None if the solver gave up
+        self.lower = lower              # proven bounds on the bipartite dimension (upper is None if unknown)
+        self.upper = upper
+        self.timings = timings          # seconds: "build:<representation>" for representations built by this run, "solve"
+        self.instrument = instrument    # phases and counters the solver reported
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self.instrument.counters
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return self.instrument.phases
+
+    @property
+    def optimal(self) -> bool:
+        return self.lower == self.upper
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+    def to_dict(self) -> dict:
+        # JSON-ready summary (without the cover); the trace is in self.instrument.write_trace
+        return {"solver": self.solver, "k": self.k, "lower": self.lower, "upper": self.upper,
+                "timings": dict(self.timings), **self.instrument.to_dict()}
+
+    def __repr__(self) -> str:
+        return f"SolveResult({self.solver}, k={self.k}, bounds=[{self.lower}, {self.upper}], time={self.total_time:.6f}s)"
+
+
+class Solver:
+
+    def __init__(self, name : str, label : str, exact : bool, run : Callable) -> None:
+        self.name = name
+        self.label = label      # name in the driver tables
+        self.exact = exact
+        self._run = run         # run(instance, budget, instrument) -> (k, cover)
+
+    def solve(self, instance : Instance, budget : Optional[Budget] = None, instrument = None) -> SolveResult:
+        budget = Budget() if (budget is None) else budget
+        instrument = Instrument(f"{self.name} on {instance.name or 'unnamed'}") if (instrument is None) else instrument
+        built_before = set(instance.build_times)
+        start = time.perf_counter()
+        with instrument.phase("solve"):
+            k, cover = self._run(instance, budget, instrument)
+        elapsed = time.perf_counter() - start
+
+        timings = {f"build:{key}": t for key, t in instance.build_times.items() if key not in built_before}
+        timings["solve"] = elapsed - sum(timings.values())
+
+        lower = instance.lower_bound
+        if k is None:
+            upper = None
+            # an exact solver that gives up within the time limit has ruled out every k <= max_k;
+            # one stopped by the time limit has not proven anything
+            if self.exact and ((budget.time_limit is None) or (elapsed < budget.time_limit)):
+                lower = max(lower, budget.max_k + 1)
+        else:
+            upper = k
+            if self.exact:
+                lower = k
+        return SolveResult(self.name, k, cover, lower, upper, timings, instrument)
+
+    def __repr__(self) -> str:
+        return f"Solver({self.name})"
+
+
+SOLVERS : Dict[str, Solver] = {}
+
+
+def register(name : str, label : str, exact : bool = False) -> Callable:
+    def decorator(run : Callable) -> Callable:
+        SOLVERS[name] = Solver(name, label, exact, run)
+        return run
+    return decorator
+
+
+def solve(name : str, instance : Instance, budget : Optional[Budget] = None, instrument = None) -> SolveResult:
+    if name not in SOLVERS:
+        raise ValueError(f"unknown solver '{name}', expected one of {sorted(SOLVERS)}")
+    return SOLVERS[name].solve(instance, budget, instrument)
+
+
+@register("kevin_sat", "Kevin (Exact)", exact=True)
+def _kevin_sat(instance : Instance, budget : Budget, instrument):
+    import exact_algo
+    solver = exact_algo.BicliqueCoverSolver(instance.edges, adjacency=instance.adjacency, instrument=instrument)
+    k = solver.solve(max_k=budget.max_k, kernel=instance.kernel)
+    if k == -1:
+        return None, None
+    return k, solver.cover
+
+
+@register("kevin_dp", "Kevin (Custom, DP)", exact=True)
+def _kevin_dp(instance : Instance, budget : Budget, instrument):
+    from custom import kevin_DP_algo
+    solver = kevin_DP_algo.BicliqueCoverSolver(instance.edges, biclique_masks=instance.biclique_masks,
+                                               instrument=instrument)
+    k = solver.solve()
+    return k, solver.find_cover()
+
+
+@register("maxsat", "MaxSAT (RC2)", exact=True)
+def _maxsat(instance : Instance, budget : Budget, instrument):
+    import maxsat_cover
+    solver = maxsat_cover.MaxSATCoverSolver(instance.edges, biclique_masks=instance.biclique_masks,
+                                            instrument=instrument)
+    k = solver.solve(time_limit=budget.time_limit)
+    if k == -1:
+        return None, None
+    return k, solver.cover
+
+
+@register("tate_greedy", "Tate (Greedy)")
+def _tate_greedy(instance : Instance, budget : Budget, instrument):
+    from approx_biclique_cover import approx_biclique_cover
+    cover = list(approx_biclique_cover(instance.graph, rng=budget.rng(), instrument=instrument))
+    return len(cover), cover
+
+
+@register("tate_optimized", "Tate (Custom)")
+def _tate_optimized(instance : Instance, budget : Budget, instrument):
+    from approx_biclique_cover import optimized_approx_biclique_cover
+    cover = list(optimized_approx_biclique_cover(instance.graph, rng=budget.rng(), instrument=instrument))
+    return len(cover), cover
+
+
+@register("tate_bitset", "Tate (Bitset)")
+def _tate_bitset(instance : Instance, budget : Budget, instrument):
+    from bitset_biclique_cover import bitset_approx_biclique_cover
+    cover = list(bitset_approx_biclique_cover(instance.graph, rng=budget.rng(), instrument=instrument))
+    return len(cover), cover
+
+
+@register("jared_matrix", "Jared (Matrix)")
+def _jared_matrix(instance : Instance, budget : Budget, instrument):
+    import ApproximationJared
+    cover = ApproximationJared.bipartite_cover(instance.biadjacency, instrument=instrument)
+    return len(cover), cover
+
+
+@register("jared_search", "Jared (Custom)")
+def _jared_search(instance : Instance, budget : Budget, instrument):
+    from custom import JaredAlgorithm
+    cover = JaredAlgorithm.recursive_search(instance.edges, instrument=instrument)
+    return len(cover), cover
+
+
+if __name__ == "__main__":
+    from cover_verifier import verify_cover
+    import datasets
+
+    for graph_name in datasets.names("test"):
+        edges = datasets.get(graph_name)
+        instance = Instance(edges, graph_name)
+        for name in SOLVERS:
+            result = solve(name, instance, Budget(seed=0))
+            print(f"{graph_name:<20} {result}  cover valid: {verify_cover(edges, result.cover)}  "
+                  f"timings={ {key: round(t, 6) for key, t in result.timings.items()} }")
+            print(result.instrument.report())
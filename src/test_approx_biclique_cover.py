@@ -2,6 +2,7 @@
 from src.graph import Graph
 from src.bipartite import CompleteBipartiteGraph
 from src.approx_biclique_cover import approx_biclique_cover
+from src.cover_verifier import verify_cover
 from statistics import mean
 from time import time
 
@@ -37,9 +38,9 @@ def main():
             print(f"\t({i+1}) \tU: {CBG.U}, \tV: {CBG.V}")
         print()
 
-        cover = CBG_sets[0].union(*CBG_sets[1:]) if (len(CBG_sets) > 1) else CBG_sets[0]
+        verdict = verify_cover(G, CBG_sets)
 
-        print(f"Covers all edges?: {cover == G}")
+        print(f"Covers all edges?: {verdict.ok} ({verdict})")
         print(f"Average runtime over {N} evaluations: \t{mean(times)} s\n\n")
     
     
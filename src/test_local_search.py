@@ -0,0 +1,87 @@
+
+from approx_biclique_cover import approx_biclique_cover, dataset_to_graph_object
+from local_search import LocalSearch
+from bipartite import Biclique
+from cover_verifier import verify_cover
+from graph_generators import planted_cover, random_bipartite
+import random
+import sys
+
+# Checks for local_search.py, run from src/:  python3 test_local_search.py [trials]
+#   known:     a cover of 4 maximal bicliques, none of them redundant, of a graph with k = 3: grow and remove_redundant
+#              cannot improve it, one absorb move (which has to swap a vertex out of the extended biclique) must
+#   planted:   LocalSearch.run lowers the greedy cover of planted_cover graphs to the planted k
+#   absorb:    absorb on every biclique of greedy covers of random graphs: the cover stays exact, and a move that fails
+#              leaves the cover exactly as it was
+
+
+KNOWN_EDGES = [(0, 6), (0, 7), (1, 4), (1, 7), (2, 4), (2, 5), (2, 6), (3, 6), (3, 7)]
+KNOWN_COVER = [Biclique({7}, {0, 1, 3}), Biclique({6}, {0, 2, 3}), Biclique({4, 5, 6}, {2}), Biclique({4, 7}, {1})]
+
+
+def check_known():
+    search = LocalSearch(dataset_to_graph_object(KNOWN_EDGES), KNOWN_COVER, random.Random(0))
+    if search.grow() or search.remove_redundant():
+        return "known: grow / remove_redundant changed the cover"
+    if not any(search.absorb(b) for b in list(search._bicliques)):
+        return "known: no absorb move succeeded"
+    verdict = verify_cover(KNOWN_EDGES, search.cover)
+    if (search.k != 3) or not verdict:
+        return f"known: k={search.k} (expected 3), {verdict}"
+    return None
+
+
+def check_planted(seed):
+    graph = planted_cover(10, 10, k=4, side=(2, 5), seed=seed)
+    edges = graph.to_list()
+    G = dataset_to_graph_object(edges)
+    greedy = list(approx_biclique_cover(G, rng=random.Random(0)))
+    improved = LocalSearch(G, greedy, random.Random(0)).run(time_budget=5.0, lower_bound=graph.upper)
+    verdict = verify_cover(edges, improved)
+    if not verdict:
+        return f"planted seed={seed}: {verdict}"
+    if len(improved) > graph.upper:
+        return f"planted seed={seed}: greedy k={len(greedy)} -> local search k={len(improved)}, planted k={graph.upper}"
+    return None
+
+
+def check_absorb(seed):
+    rng = random.Random(seed)
+    edges = random_bipartite(rng.randint(4, 15), rng.randint(4, 15), rng.uniform(0.2, 0.8), seed=seed).to_list()
+    if not edges:
+        return None
+    G = dataset_to_graph_object(edges)
+    search = LocalSearch(G, approx_biclique_cover(G, rng=random.Random(seed)), random.Random(seed))
+    for b in list(search._bicliques):
+        if b not in search._bicliques:
+            continue
+        before = dict(search._bicliques)
+        if not search.absorb(b) and (search._bicliques != before):
+            return f"absorb seed={seed}: failed move on {b} changed the cover"
+        verdict = verify_cover(edges, search.cover)
+        if not verdict:
+            return f"absorb seed={seed}: {verdict} after absorbing {b}"
+    return None
+
+
+def main():
+
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    failures = 0
+
+    message = check_known()
+    print(message or "known: passed")
+    failures += message is not None
+
+    for name, check, n in (("planted", check_planted, min(trials, 10)), ("absorb", check_absorb, trials)):
+        failed = [message for message in (check(t) for t in range(n)) if message is not None]
+        for message in failed:
+            print(message)
+        print(f"{name}: {n - len(failed)}/{n} passed")
+        failures += len(failed)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
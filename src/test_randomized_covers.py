@@ -0,0 +1,98 @@
+
+from approx_biclique_cover import approx_biclique_cover, dataset_to_graph_object, edge_key
+from bitset_biclique_cover import bitset_approx_biclique_cover
+from dynamic_cover import DynamicBicliqueCover
+from custom.kevin_DP_algo import BicliqueCoverSolver
+from cover_verifier import verify_cover
+from graph_generators import random_bipartite
+import random
+import sys
+
+# Randomized consistency checks, run from src/:  python3 test_randomized_covers.py [trials] [seed]
+#   dynamic:   DynamicBicliqueCover under random edge insertions / deletions, checked after every update against the
+#              edge set kept here (not the one the cover maintains)
+#   bitset:    bitset_approx_biclique_cover against approx_biclique_cover with the same seed: the covers must be exact
+#              and equal, biclique for biclique (same samples, ties and removal order; any batch size)
+#   symmetry:  the DP solver with symmetry canonicalization against the plain DP solver
+# Every failure prints the seed that reproduces it.
+
+
+def random_graph(rng):
+    n_u, n_v = rng.randint(2, 7), rng.randint(2, 7)
+    edges = random_bipartite(n_u, n_v, rng.uniform(0.2, 0.8), seed=rng.getrandbits(32)).to_list()
+    return n_u, n_v, edges
+
+
+def check_dynamic(seed, updates=200):
+    rng = random.Random(seed)
+    n_u, n_v, edges = random_graph(rng)
+    edges = edges or [(0, n_u)]
+    live = {edge_key(u, v) for u, v in edges}
+    dynamic = DynamicBicliqueCover(dataset_to_graph_object(edges), reoptimize_every=rng.choice((0, 4, 32)),
+                                   rng=random.Random(seed))
+
+    for step in range(updates):
+        u, v = rng.randrange(n_u), n_u + rng.randrange(n_v)
+        if edge_key(u, v) in live:
+            dynamic.delete_edge(u, v)
+            live.discard(edge_key(u, v))
+            action = "delete"
+        else:
+            dynamic.insert_edge(u, v)
+            live.add(edge_key(u, v))
+            action = "insert"
+        verdict = verify_cover(sorted(live), dynamic.cover)
+        if not verdict:
+            return f"dynamic seed={seed}: {verdict} after step {step} ({action} {u}-{v})"
+    return None
+
+
+def check_bitset(seed):
+    rng = random.Random(seed)
+    _, _, edges = random_graph(rng)
+    if not edges:
+        return None
+    G = dataset_to_graph_object(edges)
+    reference = list(approx_biclique_cover(G, rng=random.Random(seed)))
+    bitset = list(bitset_approx_biclique_cover(G, rng=random.Random(seed), batch_size=rng.choice((None, 1, 3))))
+    verdict = verify_cover(edges, bitset)
+    if not verdict:
+        return f"bitset seed={seed}: {verdict}"
+    for i, (B, B_reference) in enumerate(zip(bitset, reference)):
+        if (B.U, B.V) != (B_reference.U, B_reference.V):
+            return f"bitset seed={seed}: biclique {i} is {B}, approx_biclique_cover {B_reference}"
+    if len(bitset) != len(reference):
+        return f"bitset seed={seed}: k={len(bitset)}, approx_biclique_cover k={len(reference)}"
+    return None
+
+
+def check_symmetry(seed):
+    rng = random.Random(seed)
+    _, _, edges = random_graph(rng)
+    if not edges:
+        return None
+    plain = BicliqueCoverSolver(edges).solve()
+    symmetric = BicliqueCoverSolver(edges, symmetry=True).solve()
+    if symmetric != plain:
+        return f"symmetry seed={seed}: k={symmetric}, plain DP k={plain}"
+    return None
+
+
+def main():
+
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    base = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    failures = 0
+
+    for name, check in (("dynamic", check_dynamic), ("bitset", check_bitset), ("symmetry", check_symmetry)):
+        failed = [message for message in (check(base + t) for t in range(trials)) if message is not None]
+        for message in failed:
+            print(message)
+        print(f"{name}: {trials - len(failed)}/{trials} passed")
+        failures += len(failed)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()